@@ -0,0 +1,62 @@
+"""audit payload as JSONB with a GIN (jsonb_path_ops) index
+
+Revision ID: a81d5f3c6e27
+Revises: f2b6e8a41c93
+Create Date: 2026-10-17 18:02:11.417935
+
+Changing the column type rewrites every audit_logs partition under an
+ACCESS EXCLUSIVE lock, so run this in a maintenance window on large
+installations. The GIN index itself is built concurrently per partition
+(see f2b6e8a41c93 for the ON ONLY / ATTACH procedure).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81d5f3c6e27'
+down_revision: Union[str, Sequence[str], None] = 'f2b6e8a41c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _partitions() -> list[str]:
+    return list(op.get_bind().execute(sa.text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'audit_logs'::regclass ORDER BY c.relname"
+    )).scalars())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('audit_logs', 'audit_outbox'):
+        op.alter_column(
+            table, 'payload',
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using='payload::jsonb',
+        )
+
+    op.execute('CREATE INDEX IF NOT EXISTS ix_audit_logs_payload ON ONLY audit_logs USING gin (payload jsonb_path_ops)')
+    with op.get_context().autocommit_block():
+        for partition in _partitions():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition}_payload_idx ON {partition} USING gin (payload jsonb_path_ops)')
+            op.execute(f'ALTER INDEX ix_audit_logs_payload ATTACH PARTITION {partition}_payload_idx')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_logs_payload', table_name='audit_logs')
+
+    for table in ('audit_logs', 'audit_outbox'):
+        op.alter_column(
+            table, 'payload',
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using='payload::json',
+        )
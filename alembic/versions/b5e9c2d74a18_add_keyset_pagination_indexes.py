@@ -0,0 +1,34 @@
+"""add (created_at, id) indexes for keyset pagination of users and tenants
+
+Revision ID: b5e9c2d74a18
+Revises: a81d5f3c6e27
+Create Date: 2026-10-17 19:26:44.108352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e9c2d74a18'
+down_revision: Union[str, Sequence[str], None] = 'a81d5f3c6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_tenant_created_at', 'users', ['tenant_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_users_created_at', 'users', ['created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tenants_created_at', 'tenants', ['created_at', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tenants_created_at', table_name='tenants', postgresql_concurrently=True)
+        op.drop_index('ix_users_created_at', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_tenant_created_at', table_name='users', postgresql_concurrently=True)
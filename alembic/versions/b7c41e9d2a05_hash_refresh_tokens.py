@@ -0,0 +1,53 @@
+"""store refresh tokens as binary sha256 digests
+
+Revision ID: b7c41e9d2a05
+Revises: 4f5eb676bcc6
+Create Date: 2026-10-17 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c41e9d2a05'
+down_revision: Union[str, Sequence[str], None] = '4f5eb676bcc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows hold the raw token. Replace it with its SHA-256
+    # digest, which is exactly how the service looks up tokens that
+    # are not in the `<id>.<secret>` format, so sessions stay valid.
+    op.add_column('refresh_tokens', sa.Column('token_digest', postgresql.BYTEA(), nullable=True))
+    op.execute(
+        "UPDATE refresh_tokens "
+        "SET token_digest = sha256(convert_to(token_hash, 'UTF8'))"
+    )
+    op.drop_index('ix_refresh_tokens_token_hash', table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.alter_column('refresh_tokens', 'token_digest', new_column_name='token_hash', nullable=False)
+    op.create_check_constraint(
+        'ck_refresh_tokens_token_hash_length',
+        'refresh_tokens',
+        'octet_length(token_hash) = 32',
+    )
+    op.create_index('ux_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered from digests: every issued refresh
+    # token stops working and users have to log in again.
+    op.drop_index('ux_refresh_tokens_token_hash', table_name='refresh_tokens')
+    op.drop_constraint('ck_refresh_tokens_token_hash_length', 'refresh_tokens', type_='check')
+    op.add_column('refresh_tokens', sa.Column('token_text', sa.String(length=255), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token_text = encode(token_hash, 'hex'), revoked_at = COALESCE(revoked_at, now())")
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.alter_column('refresh_tokens', 'token_text', new_column_name='token_hash', nullable=False)
+    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=False)
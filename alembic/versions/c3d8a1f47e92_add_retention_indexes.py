@@ -0,0 +1,39 @@
+"""add indexes used by the retention reaper
+
+Revision ID: c3d8a1f47e92
+Revises: b7c41e9d2a05
+Create Date: 2026-10-17 11:40:06.274519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8a1f47e92'
+down_revision: Union[str, Sequence[str], None] = 'b7c41e9d2a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently: these tables are large and written on every login
+    with op.get_context().autocommit_block():
+        op.create_index('ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_refresh_tokens_revoked_at', 'refresh_tokens', ['revoked_at'], unique=False, postgresql_where=sa.text('revoked_at IS NOT NULL'), postgresql_concurrently=True)
+        # Deleting a token sets replaced_by = NULL on its predecessor; without
+        # this index every deleted row costs a sequential scan
+        op.create_index('ix_refresh_tokens_replaced_by', 'refresh_tokens', ['replaced_by'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_login_attempts_created_at', 'login_attempts', ['created_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_login_attempts_created_at', table_name='login_attempts', postgresql_concurrently=True)
+        op.drop_index('ix_refresh_tokens_replaced_by', table_name='refresh_tokens', postgresql_concurrently=True)
+        op.drop_index('ix_refresh_tokens_revoked_at', table_name='refresh_tokens', postgresql_concurrently=True)
+        op.drop_index('ix_refresh_tokens_expires_at', table_name='refresh_tokens', postgresql_concurrently=True)
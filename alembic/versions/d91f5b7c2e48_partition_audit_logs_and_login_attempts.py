@@ -0,0 +1,111 @@
+"""range-partition audit_logs and login_attempts by month
+
+Revision ID: d91f5b7c2e48
+Revises: c3d8a1f47e92
+Create Date: 2026-10-17 14:03:52.661087
+
+Both tables are rebuilt as `PARTITION BY RANGE (created_at)` with one
+partition per month (`<table>_pYYYYMM`) covering existing rows plus the
+next few months; PartitionManager keeps creating them from there on.
+The primary key becomes (id, created_at), since Postgres requires the
+partition key in every unique constraint.
+
+Rows are copied with INSERT ... SELECT while the tables are locked, so
+run this in a maintenance window on large installations.
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91f5b7c2e48'
+down_revision: Union[str, Sequence[str], None] = 'c3d8a1f47e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 3
+
+TABLES = {
+    'audit_logs': {
+        'foreign_keys': [
+            ('actor_id', 'users', 'SET NULL'),
+            ('tenant_id', 'tenants', 'RESTRICT'),
+        ],
+        'indexes': [
+            ('ix_audit_logs_action', ['action']),
+            ('ix_audit_logs_actor_id', ['actor_id']),
+            ('ix_audit_logs_resource', ['resource_type', 'resource_id']),
+            ('ix_audit_logs_tenant_id', ['tenant_id']),
+        ],
+    },
+    'login_attempts': {
+        'foreign_keys': [
+            ('tenant_id', 'tenants', 'RESTRICT'),
+            ('user_id', 'users', 'SET NULL'),
+        ],
+        'indexes': [
+            ('ix_login_attempts_email', ['email']),
+            ('ix_login_attempts_tenant_id', ['tenant_id']),
+        ],
+    },
+}
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _rebuild(table: str, *, partitioned: bool) -> None:
+    """Copies `table` into a new (partitioned or plain) table of the same name."""
+    spec = TABLES[table]
+    staging = f'{table}_rebuild'
+
+    partition_clause = ' PARTITION BY RANGE (created_at)' if partitioned else ''
+    op.execute(f'CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS){partition_clause}')
+
+    if partitioned:
+        oldest = op.get_bind().execute(sa.text(f'SELECT min(created_at) FROM {table}')).scalar()
+        this_month = datetime.now(timezone.utc).date().replace(day=1)
+        month = oldest.date().replace(day=1) if oldest else this_month
+        while month <= _add_months(this_month, PREMAKE_MONTHS):
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {staging} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+
+    op.execute(f'INSERT INTO {staging} SELECT * FROM {table}')
+    op.drop_table(table)
+    op.rename_table(staging, table)
+
+    if partitioned:
+        op.create_primary_key(f'{table}_pkey', table, ['id', 'created_at'])
+    else:
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+        op.create_unique_constraint(f'{table}_id_key', table, ['id'])
+
+    for column, target, ondelete in spec['foreign_keys']:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, target, [column], ['id'], ondelete=ondelete,
+        )
+    for name, columns in spec['indexes']:
+        op.create_index(name, table, columns, unique=False)
+    op.create_index(f'ix_{table}_created_at', table, ['created_at'], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        _rebuild(table, partitioned=False)
+    # Only login_attempts had a created_at index before this revision
+    op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
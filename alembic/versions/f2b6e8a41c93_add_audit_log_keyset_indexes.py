@@ -0,0 +1,82 @@
+"""add (..., created_at, id) indexes for audit log keyset pagination
+
+Revision ID: f2b6e8a41c93
+Revises: e4a7c9d13b56
+Create Date: 2026-10-17 17:12:48.530716
+
+audit_logs is partitioned, and Postgres cannot build an index on a
+partitioned table concurrently. Each index is therefore declared on the
+parent only (ON ONLY, instantly, invalid), built concurrently on every
+partition and attached; once every partition is attached the parent
+index becomes valid. Partitions created later inherit the index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6e8a41c93'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c9d13b56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_audit_logs_tenant_created_at', ['tenant_id', 'created_at', 'id']),
+    ('ix_audit_logs_actor_created_at', ['actor_id', 'created_at', 'id']),
+    ('ix_audit_logs_action_created_at', ['tenant_id', 'action', 'created_at', 'id']),
+    ('ix_audit_logs_resource_created_at', ['resource_type', 'resource_id', 'created_at', 'id']),
+]
+
+# Superseded by the indexes above
+OLD_INDEXES = [
+    ('ix_audit_logs_actor_id', ['actor_id']),
+    ('ix_audit_logs_action', ['action']),
+    ('ix_audit_logs_resource', ['resource_type', 'resource_id']),
+]
+
+
+def _partitions() -> list[str]:
+    return list(op.get_bind().execute(sa.text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'audit_logs'::regclass ORDER BY c.relname"
+    )).scalars())
+
+
+def _create_partitioned_index(name: str, columns: list[str]) -> None:
+    column_list = ', '.join(columns)
+    op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON ONLY audit_logs ({column_list})')
+    with op.get_context().autocommit_block():
+        for partition in _partitions():
+            # Same naming as Postgres uses for indexes it creates on partitions
+            partition_index = f"{partition}_{'_'.join(columns)}_idx"
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} ({column_list})')
+            op.execute(f'ALTER INDEX {name} ATTACH PARTITION {partition_index}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in INDEXES:
+        _create_partitioned_index(name, columns)
+
+    # created_at gains id as a tie-breaker for the unfiltered listing
+    op.execute('ALTER INDEX ix_audit_logs_created_at RENAME TO ix_audit_logs_created_at_old')
+    _create_partitioned_index('ix_audit_logs_created_at', ['created_at', 'id'])
+    op.drop_index('ix_audit_logs_created_at_old', table_name='audit_logs')
+
+    for name, _ in OLD_INDEXES:
+        op.drop_index(name, table_name='audit_logs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in OLD_INDEXES:
+        _create_partitioned_index(name, columns)
+
+    op.execute('ALTER INDEX ix_audit_logs_created_at RENAME TO ix_audit_logs_created_at_old')
+    _create_partitioned_index('ix_audit_logs_created_at', ['created_at'])
+    op.drop_index('ix_audit_logs_created_at_old', table_name='audit_logs')
+
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name='audit_logs')
@@ -1,43 +1,73 @@
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps.db import get_db
+from app.api.deps.principal import get_current_principal
 from app.api.deps.tenant import get_current_tenant
+from app.core.logging import get_logger
+from app.domains.rbac.roles.cache import role_permission_cache
+from app.domains.users.cache import user_security_versions
+from app.domains.users.projections import AuthenticatedUser
 from app.domains.users.repository import UserRepository
-from app.security.tokens import decode_token
+from app.security.principal import Principal
 
-security = HTTPBearer()
+logger = get_logger(__name__)
 
 
-async def get_current_user(
-    auth: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_db),
-    current_tenant=Depends(get_current_tenant),
-):
+async def _versions_current(principal: Principal) -> bool:
     """
-    Validates JWT and loads the authenticated user
-    strictly within the tenant boundary.
+    True if the token's user and role versions still match Redis.
+    Any lookup failure, or a missing user version, counts as stale.
     """
-    token = auth.credentials
+    if not principal.has_version_claims:
+        return False
 
     try:
-        payload = decode_token(token)
-        user_id = payload.get("sub")
+        user_version = await user_security_versions.current(principal.user_id)
+        if user_version is None or user_version != principal.user_version:
+            return False
+        if principal.role_id is None:
+            return True
+        return (
+            await role_permission_cache.current_version(principal.role_id)
+            == principal.role_version
+        )
+    except Exception:
+        logger.warning("Security version lookup failed, using database path", exc_info=True)
+        return False
 
-        if not user_id:
-            raise ValueError("Missing sub in token")
 
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_db),
+    current_tenant=Depends(get_current_tenant),
+) -> AuthenticatedUser:
+    """
+    Resolves the authenticated user for the request principal, strictly
+    within the tenant boundary.
+
+    Fast path: tokens whose version claims are still current are
+    trusted as-is (they are only issued to active users, and any
+    status or role change bumps the user version), so no DB query is
+    made. Otherwise a slim projection is loaded from the database.
+    """
+    # --- Stateless fast path ---
+    # Tenant status was already enforced by get_current_tenant
+    if await _versions_current(principal):
+        return AuthenticatedUser(
+            id=principal.user_id,
+            user_status="active",
+            tenant_id=principal.tenant_id,
+            role_id=principal.role_id,
+            role=(
+                await role_permission_cache.get(session, principal.role_id)
+                if principal.role_id else None
+            ),
         )
 
     user_repo = UserRepository(session)
-    user = await user_repo.get_by_id(
-        id=user_id,
+    user = await user_repo.get_auth_projection(
+        user_id=principal.user_id,
         tenant_id=current_tenant.id if current_tenant else None,
     )
 
@@ -58,4 +88,10 @@ async def get_current_user(
                 detail="Tenant is inactive",
             )
 
-    return user
+    return AuthenticatedUser(
+        id=user.id,
+        user_status=user.user_status,
+        tenant_id=user.tenant_id,
+        role_id=user.role_id,
+        role=await role_permission_cache.get(session, user.role_id),
+    )
@@ -1,6 +1,7 @@
 from typing import AsyncGenerator
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.infrastructure.db.session import AsyncSessionLocal
+from app.infrastructure.db.session import AsyncSessionLocal, discard_commit_hooks, run_commit_hooks
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -9,8 +10,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
             await session.commit()   # ✅ COMMIT HERE
         except Exception:
+            discard_commit_hooks(session)
             await session.rollback() # ✅ ROLLBACK ON ERROR
             raise
+        else:
+            await run_commit_hooks(session)
         finally:
             await session.close()
 
+
+async def release_db(session: AsyncSession = Depends(get_db)) -> None:
+    """
+    Ends the request session's transaction once the dependencies declared
+    before it (authentication) have used it, so its connection goes back
+    to the pool. For long-lived responses, such as streams, that do their
+    own database work; get_db still closes the session afterwards.
+    """
+    await session.commit()
@@ -0,0 +1,26 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+
+from app.security.principal import Principal
+from app.security.tokens import decode_token
+
+security = HTTPBearer()
+
+
+async def get_current_principal(
+    auth: HTTPAuthorizationCredentials = Depends(security),
+) -> Principal:
+    """
+    Verifies the bearer token exactly once per request.
+    FastAPI caches dependency results per request, so tenant, user
+    and permission dependencies all share this same Principal.
+    """
+    try:
+        payload = decode_token(auth.credentials)
+        return Principal.from_claims(payload)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
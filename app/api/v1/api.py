@@ -5,6 +5,7 @@ from app.api.v1.users.routes import router as users_router
 from app.api.v1.tenants.routes import router as tenants_router
 from app.api.v1.rbac.permissions.routes import router as permissions_router
 from app.api.v1.rbac.roles.routes import router as roles_router
+from app.api.v1.audit.routes import router as audit_router
 
 api_router = APIRouter()
 api_router.include_router(health_router)
@@ -12,4 +13,5 @@ api_router.include_router(auth_router)
 api_router.include_router(users_router)
 api_router.include_router(tenants_router)
 api_router.include_router(permissions_router)
-api_router.include_router(roles_router)
\ No newline at end of file
+api_router.include_router(roles_router)
+api_router.include_router(audit_router)
\ No newline at end of file
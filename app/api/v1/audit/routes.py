@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps.db import get_db, release_db
+from app.api.deps.auth import get_current_user
+from app.api.deps.permissions import PermissionChecker
+from app.core.responses import ClosingStreamingResponse, SuccessResponse
+
+from app.domains.audit.repository import AuditLogRepository
+from app.domains.audit.service import AuditService
+from app.domains.audit.export import MEDIA_TYPES
+from app.domains.audit.schemas import AuditLogExportParams, AuditLogListParams, AuditLogSchema
+from app.domains.shared.schemas.pagination import PaginatedData
+
+router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
+
+
+@router.get(
+    "/",
+    response_model=SuccessResponse[PaginatedData[AuditLogSchema]],
+    dependencies=[Depends(PermissionChecker("audit:view"))],
+)
+async def list_audit_logs(
+    params: AuditLogListParams = Depends(),
+    session: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Newest-first audit trail, cursor paginated.
+    Tenant users are scoped to their tenant; `tenant_id` is honoured for system users only.
+    """
+    service = AuditService(AuditLogRepository(session))
+    result = await service.list_logs(actor=current_user, params=params)
+
+    return SuccessResponse(
+        data=result,
+        message="Audit logs retrieved successfully",
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    # The export reads through its own sessions; authentication's
+    # connection is released before streaming starts
+    dependencies=[Depends(PermissionChecker("audit:view")), Depends(release_db)],
+)
+async def export_audit_logs(
+    params: AuditLogExportParams = Depends(),
+    current_user=Depends(get_current_user),
+):
+    """
+    Streams the audit trail (oldest first) as NDJSON or CSV.
+    To resume an interrupted export, repeat the request with `cursor` set
+    to the cursor of the last row received.
+    """
+    service = AuditService()
+    chunks = await service.export_logs(actor=current_user, params=params)
+
+    # Closes the export (and frees its admission slot) however the stream ends
+    return ClosingStreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[params.format],
+        headers={"Content-Disposition": f'attachment; filename="audit-logs.{params.format}"'},
+    )
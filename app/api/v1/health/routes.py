@@ -5,6 +5,20 @@ from sqlalchemy import text
 from app.api.deps.db import get_db
 from app.infrastructure.clients.redis_client import redis_client
 from app.core.logging import get_logger
+from app.security.tokens import token_cache
+from app.domains.auth.service import login_admission
+from app.security.hashing import hashing_admission
+from app.domains.rbac.roles.cache import role_permission_cache
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
+from app.domains.tenants.cache import tenant_cache
+from app.domains.users.cache import user_security_versions
+from app.domains.auth.session_store import session_persister
+from app.infrastructure.db.reaper import reaper
+from app.infrastructure.db.partitions import partition_manager
+from app.domains.audit.writer import audit_writer
+from app.domains.audit.outbox import audit_outbox_relay
+from app.domains.audit.export import audit_exporter
+from app.domains.shared.counting import count_strategy
 
 logger = get_logger(__name__)
 router = APIRouter(tags=["Health"])
@@ -38,3 +52,26 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         "status": status,
         "checks": checks,
     }
+
+
+@router.get("/health/metrics")
+async def process_metrics():
+    """
+    Process-local cache and queue statistics for this worker.
+    """
+    return {
+        "token_cache": token_cache.stats(),
+        "login_admission": login_admission.stats(),
+        "password_hashing": hashing_admission.stats(),
+        "role_permission_cache": role_permission_cache.stats(),
+        "tenant_cache": tenant_cache.stats(),
+        "user_security_versions": user_security_versions.stats(),
+        "session_persister": session_persister.stats(),
+        "reaper": reaper.stats(),
+        "partitions": partition_manager.stats(),
+        "audit_writer": audit_writer.stats(),
+        "audit_outbox_relay": audit_outbox_relay.stats(),
+        "audit_export": audit_exporter.stats(),
+        "listing_counts": count_strategy.stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+    }
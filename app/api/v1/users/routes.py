@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps.db import get_db
 from app.api.deps.auth import get_current_user
-from app.infrastructure.db.models.user import User
+from app.domains.users.projections import AuthenticatedUser
 from app.api.deps.permissions import PermissionChecker
 
 from app.domains.users.schemas import UserCreateSchema, UserSchema, UserUpdateSchema, UserFilterParams, UserRoleAssignSchema, UserMeSchema
@@ -13,35 +13,55 @@ from app.domains.users.service import UserService
 
 from app.domains.tenants.repository import TenantRepository
 from app.domains.rbac.roles.repository import RoleRepository
-from app.domains.shared.schemas.pagination import PaginationParams, PaginatedData, PaginationMeta
+from app.domains.tenants.cache import tenant_cache
+from app.domains.shared.schemas.pagination import PaginationParams, PaginatedData
 
 from app.domains.audit.repository import AuditLogRepository
 from app.domains.audit.service import AuditService
 from app.domains.audit.schemas import AuditLogCreate
 
 from app.core.responses import SuccessResponse
+from app.core.exceptions import ResourceNotFound
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get("/me", response_model=SuccessResponse[UserMeSchema])
 async def read_user_me(
-    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     Returns the profile + RBAC context of the currently authenticated user.
     """
 
     role = current_user.role
-    permissions = [p.slug for p in role.permissions]
+    if not role:
+        raise ResourceNotFound("Role not found")
 
-    data = UserMeSchema(
-        id=current_user.id,
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
+    permissions = sorted(role.permissions.slugs)
 
+    # Profile fields are not part of the auth projection; load them here
+    user = await UserRepository(session).get_by_id_scoped(
+        user_id=current_user.id,
         tenant_id=current_user.tenant_id,
-        tenant_name=current_user.tenant.name if current_user.tenant else None,
+    )
+    if not user:
+        raise ResourceNotFound("User not found")
+
+    tenant = (
+        await tenant_cache.get(session, current_user.tenant_id)
+        if current_user.tenant_id
+        else None
+    )
+
+    data = UserMeSchema(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+
+        tenant_id=user.tenant_id,
+        tenant_name=tenant.name if tenant else None,
 
         role_id=role.id,
         role_name=role.name,
@@ -121,21 +141,14 @@ async def list_users(
         role_repo=None,
     )
 
-    users, total = await service.list_users(
+    result = await service.list_users(
         actor=current_user,
         pagination=pagination,
         filters=filters,
     )
 
     return SuccessResponse(
-        data=PaginatedData(
-            items=[UserSchema.model_validate(u) for u in users],
-            pagination=PaginationMeta.create(
-                page=pagination.page,
-                page_size=pagination.page_size,
-                total_items=total,
-            ),
-        ),
+        data=result,
         message="Users retrieved successfully",
     )
 
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from app.security.keys import key_ring
+
+router = APIRouter(prefix="/.well-known", tags=["Discovery"])
+
+
+@router.get("/jwks.json", include_in_schema=False)
+async def jwks():
+    """
+    Public JWT verification keys.
+    The document is serialized once at startup; clients may cache it.
+    """
+    return Response(
+        content=key_ring.jwks_json,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.core.exceptions import ServiceUnavailable
+
+
+class AdmissionController:
+    """
+    Caps how many expensive operations run concurrently in this process.
+
+    Callers beyond `max_concurrent` wait in a bounded queue for at most
+    `queue_timeout_seconds`. When the queue is full, or the deadline
+    passes, the call is shed with a 503 instead of piling up work.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Metrics
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+        self._wait_total_seconds = 0.0
+        self._wait_max_seconds = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+        started = time.perf_counter()
+
+        if not semaphore.locked():
+            # Fast path: a free slot is taken without suspending
+            await semaphore.acquire()
+        else:
+            # Shed early: no point queueing behind a full line
+            if self.queue_depth >= self.max_queue:
+                self.shed_queue_full += 1
+                raise ServiceUnavailable(error_code="OVERLOADED")
+
+            self.queue_depth += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout_seconds)
+            except asyncio.TimeoutError:
+                self.shed_timeout += 1
+                raise ServiceUnavailable(error_code="OVERLOADED")
+            finally:
+                self.queue_depth -= 1
+
+        waited = time.perf_counter() - started
+        self.admitted += 1
+        self._wait_total_seconds += waited
+        self._wait_max_seconds = max(self._wait_max_seconds, waited)
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "admitted": self.admitted,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_timeout": self.shed_timeout,
+            "wait_avg_ms": round(self._wait_total_seconds / self.admitted * 1000, 2) if self.admitted else 0.0,
+            "wait_max_ms": round(self._wait_max_seconds * 1000, 2),
+        }
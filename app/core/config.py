@@ -1,3 +1,5 @@
+from typing import Dict, List, Literal, Optional, Union
+
 from pydantic_settings import BaseSettings
 
 
@@ -21,8 +23,103 @@ class Settings(BaseSettings):
     # Security
     PUBLIC_KEY: str
     PRIVATE_KEY: str
+    JWT_ALGORITHM: Literal["RS256", "ES256", "EdDSA"] = "RS256"
+    # kid of the active key; defaults to its RFC 7638 thumbprint
+    JWT_KEY_ID: Optional[str] = None
+    # Extra public keys accepted for verification during rotation: PEM
+    # strings, or {"kid": ..., "pem": ...} to keep a retired key's kid
+    JWT_VERIFICATION_KEYS: List[Union[str, Dict[str, str]]] = []
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 150
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # HMAC key for pagination cursors; derived from PRIVATE_KEY when unset
+    CURSOR_SIGNING_KEY: Optional[str] = None
+
+    # Password hashing parameters (profile, with optional overrides)
+    PASSWORD_HASH_PROFILE: Literal["constrained", "standard", "hardened"] = "standard"
+    PASSWORD_HASH_TIME_COST: Optional[int] = None
+    PASSWORD_HASH_MEMORY_COST: Optional[int] = None  # KiB
+    PASSWORD_HASH_PARALLELISM: Optional[int] = None
+
+    # Password hashing pool ("thread" or "process")
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT_MS: int = 2000
+
+    # Login admission control (concurrent password verifications)
+    LOGIN_MAX_CONCURRENT_VERIFICATIONS: int = 4
+    LOGIN_MAX_QUEUE: int = 32
+    LOGIN_QUEUE_TIMEOUT_MS: int = 2000
+
+    # Cross-worker cache invalidation (Redis pub/sub)
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    CACHE_INVALIDATION_BATCH_MS: int = 20
+    CACHE_INVALIDATION_MAX_BATCH: int = 500
+
+    # Max seconds a worker may serve outdated role permissions
+    RBAC_CACHE_STALENESS_SECONDS: int = 5
+    # Max roles cached per worker (least recently used are evicted)
+    RBAC_CACHE_MAX_SIZE: int = 10000
+
+    # Tenant snapshot cache used by request authentication
+    TENANT_CACHE_TTL_SECONDS: int = 60
+    TENANT_CACHE_NEGATIVE_TTL_SECONDS: int = 30
+    TENANT_CACHE_MAX_SIZE: int = 10000
+
+    # Refresh token store ("redis": sessions live in Redis and are
+    # persisted to Postgres asynchronously in batches, for audit)
+    SESSION_STORE: Literal["database", "redis"] = "database"
+    SESSION_PERSIST_BATCH_MS: int = 200
+    SESSION_PERSIST_MAX_BATCH: int = 500
+    SESSION_PERSIST_MAX_RETRIES: int = 5
+    SESSION_SPILL_PATH: str = "var/session-spill.ndjson"
+
+    # Retention reaper: how long refresh tokens are kept past expiry,
+    # and how hard the cleanup may push
+    REAPER_ENABLED: bool = True
+    REFRESH_TOKEN_RETENTION_DAYS: int = 7
+    REAPER_INTERVAL_SECONDS: int = 300
+    REAPER_BATCH_SIZE: int = 1000
+    REAPER_BATCH_PAUSE_MS: int = 100
+    REAPER_MAX_BATCHES_PER_RUN: int = 50
+    REAPER_LOCK_TIMEOUT_MS: int = 500
+
+    # Monthly partitions of audit_logs / login_attempts: created ahead of
+    # time, dropped once older than the retention (0 keeps audit logs forever)
+    PARTITION_PREMAKE_MONTHS: int = 3
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = 3600
+    AUDIT_LOG_RETENTION_DAYS: int = 0
+    LOGIN_ATTEMPT_RETENTION_DAYS: int = 90
+
+    # Audit writes: "sync" inserts inside the request transaction,
+    # "buffered" queues committed entries for batched background inserts,
+    # "outbox" writes to audit_outbox in the request transaction and a
+    # relay moves them to the sink ("database" = audit_logs, or "file")
+    AUDIT_WRITE_MODE: Literal["sync", "buffered", "outbox"] = "sync"
+    AUDIT_BUFFER_MAX_SIZE: int = 10000
+    AUDIT_FLUSH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_MS: int = 500
+    AUDIT_SPILL_PATH: str = "var/audit-spill.ndjson"
+    AUDIT_OUTBOX_SINK: Literal["database", "file"] = "database"
+    AUDIT_OUTBOX_BATCH_SIZE: int = 1000
+    AUDIT_OUTBOX_POLL_MS: int = 500
+    AUDIT_OUTBOX_FILE_PATH: str = "var/audit.ndjson"
+
+    # Streaming audit exports: rows per fetch/chunk, rows per transaction,
+    # how long a stalled client may hold a transaction open, and how
+    # many exports may run at once per process
+    AUDIT_EXPORT_BATCH_SIZE: int = 1000
+    AUDIT_EXPORT_SEGMENT_ROWS: int = 100000
+    AUDIT_EXPORT_IDLE_TIMEOUT_SECONDS: int = 60
+    AUDIT_EXPORT_MAX_CONCURRENT: int = 2
+
+    # Listing totals: exact up to this many rows, estimated beyond;
+    # seconds a computed total is cached in Redis (0 disables the cache)
+    COUNT_EXACT_THRESHOLD: int = 10000
+    COUNT_CACHE_TTL_SECONDS: int = 30
+
+    # Verified-token cache (0 disables it)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
 
     class Config:
         env_file = ".env"
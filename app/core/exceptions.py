@@ -54,3 +54,20 @@ class ResourceConflict(AppException):
     status_code = 409
     error_code = "RESOURCE_CONFLICT"
     message = "Resource with given attributes already exists"
+
+class InvalidQuery(AppException):
+    status_code = 400
+    error_code = "INVALID_QUERY"
+    message = "Invalid query parameters"
+
+class InvalidCursor(AppException):
+    status_code = 400
+    error_code = "INVALID_CURSOR"
+    message = "Pagination cursor is invalid or expired"
+
+# ---- Capacity ----
+
+class ServiceUnavailable(AppException):
+    status_code = 503
+    error_code = "SERVICE_UNAVAILABLE"
+    message = "Service is temporarily overloaded, please retry shortly"
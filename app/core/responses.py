@@ -1,4 +1,6 @@
 from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 from typing import Generic, Optional, TypeVar
 
 T = TypeVar("T")
@@ -18,3 +20,17 @@ class SuccessResponse(BaseModel, Generic[T]):
     success: bool = True
     data: T
     message: Optional[str] = None
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that always closes its body iterator, including
+    when the client disconnects before or during the body (Starlette then
+    skips background tasks and leaves the iterator to garbage collection).
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
@@ -0,0 +1,198 @@
+import csv
+import io
+import json
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.core.admission import AdmissionController
+from app.core.config import settings
+from app.domains.audit.repository import AUDIT_EXPORT_ORDER, AuditLogRepository
+from app.infrastructure.db.models.audit import AuditLog
+from app.infrastructure.db.session import AsyncSessionLocal
+
+COLUMNS = [
+    "id", "created_at", "tenant_id", "actor_id", "action", "resource_type",
+    "resource_id", "ip_address", "user_agent", "payload", "cursor",
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _record(log: AuditLog) -> Dict[str, Any]:
+    return {
+        "id": str(log.id),
+        "created_at": log.created_at.isoformat(),
+        "tenant_id": str(log.tenant_id) if log.tenant_id else None,
+        "actor_id": str(log.actor_id) if log.actor_id else None,
+        "action": log.action,
+        "resource_type": log.resource_type,
+        "resource_id": log.resource_id,
+        "ip_address": str(log.ip_address) if log.ip_address else None,
+        "user_agent": log.user_agent,
+        "payload": log.payload,
+        "cursor": AUDIT_EXPORT_ORDER.encode(log),
+    }
+
+
+def _encode_ndjson(logs: List[AuditLog]) -> bytes:
+    return "".join(json.dumps(_record(log), default=str) + "\n" for log in logs).encode()
+
+
+def _encode_csv(logs: List[AuditLog]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for log in logs:
+        record = _record(log)
+        if record["payload"] is not None:
+            record["payload"] = json.dumps(record["payload"], default=str)
+        writer.writerow(record[column] for column in COLUMNS)
+    return buffer.getvalue().encode()
+
+
+class ExportStream:
+    """
+    Chunks of an admitted export. The export holds its admission slot
+    until it is exhausted or aclose() is called, which also works when
+    iteration never started (client gone before the body).
+    """
+
+    def __init__(self, first: bytes, chunks: AsyncIterator[bytes]):
+        self._first: Optional[bytes] = first
+        self._chunks = chunks
+
+    def __aiter__(self) -> "ExportStream":
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self._first is not None:
+            first, self._first = self._first, None
+            return first
+        return await anext(self._chunks)
+
+    async def aclose(self) -> None:
+        self._first = None
+        await self._chunks.aclose()
+
+
+class AuditExporter:
+    """
+    Streams audit entries as NDJSON or CSV without loading them.
+
+    - Rows come from a server-side cursor, `batch_size` at a time, and
+      each batch becomes one response chunk: memory stays constant
+      whatever the size of the export.
+    - The next batch is only fetched once the previous chunk has been
+      handed to the client, so a slow reader slows the cursor down
+      instead of piling chunks up in memory.
+    - Every `segment_rows` rows the transaction is closed and a new one
+      resumes from the last (created_at, id) position, so a long export
+      never pins one snapshot (and vacuum) for its whole duration. A
+      client that stops reading for longer than `idle_timeout_seconds`
+      has its transaction ended by Postgres.
+    - Each row carries its resumption `cursor`.
+    - Concurrent exports are capped per process, since each one holds a
+      pooled connection for as long as it runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        segment_rows: int,
+        idle_timeout_seconds: int,
+        admission: AdmissionController,
+    ):
+        self.batch_size = batch_size
+        self.segment_rows = segment_rows
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.admission = admission
+
+        self.exported = 0
+
+    async def _segment(
+        self,
+        after: Optional[Tuple[datetime, UUID]],
+        filters: Dict[str, Any],
+    ) -> AsyncIterator[List[AuditLog]]:
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(text("SET TRANSACTION READ ONLY"))
+                await session.execute(text(
+                    f"SET LOCAL idle_in_transaction_session_timeout = {int(self.idle_timeout_seconds * 1000)}"
+                ))
+                result = await AuditLogRepository(session).stream_keyset(
+                    batch_size=self.batch_size,
+                    after=after,
+                    limit=self.segment_rows,
+                    **filters,
+                )
+                async for batch in result.partitions():
+                    yield batch
+                    # The chunk has been sent; keep the session from holding on to it
+                    session.expunge_all()
+
+    async def _stream(
+        self,
+        *,
+        format: str,
+        after: Optional[Tuple[datetime, UUID]],
+        filters: Dict[str, Any],
+    ) -> AsyncIterator[bytes]:
+        encode = _encode_csv if format == "csv" else _encode_ndjson
+
+        async with self.admission.slot():
+            # Admitted; the header is the first chunk (empty for NDJSON)
+            yield (",".join(COLUMNS) + "\r\n").encode() if format == "csv" else b""
+
+            while True:
+                rows = 0
+                async with aclosing(self._segment(after, filters)) as batches:
+                    async for batch in batches:
+                        rows += len(batch)
+                        self.exported += len(batch)
+                        after = (batch[-1].created_at, batch[-1].id)
+                        yield encode(batch)
+
+                if rows < self.segment_rows:
+                    return
+
+    async def open(
+        self,
+        *,
+        format: str,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        filters: Dict[str, Any],
+    ) -> "ExportStream":
+        """
+        Admits the export and returns its chunks. Raises ServiceUnavailable
+        right away (before any byte is sent) when at capacity.
+        """
+        chunks = self._stream(format=format, after=after, filters=filters)
+        first = await anext(chunks)
+        return ExportStream(first, chunks)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "exported": self.exported,
+            **self.admission.stats(),
+        }
+
+
+audit_exporter = AuditExporter(
+    batch_size=settings.AUDIT_EXPORT_BATCH_SIZE,
+    segment_rows=settings.AUDIT_EXPORT_SEGMENT_ROWS,
+    idle_timeout_seconds=settings.AUDIT_EXPORT_IDLE_TIMEOUT_SECONDS,
+    admission=AdmissionController(
+        "audit_export",
+        max_concurrent=settings.AUDIT_EXPORT_MAX_CONCURRENT,
+        max_queue=0,
+        queue_timeout_seconds=0,
+    ),
+)
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+_COLUMNS = (
+    "id, created_at, tenant_id, actor_id, action, resource_type, "
+    "resource_id, ip_address, user_agent, payload"
+)
+
+_CLAIM = (
+    "SELECT id FROM audit_outbox ORDER BY id "
+    "LIMIT :limit FOR UPDATE SKIP LOCKED"
+)
+
+# Moves one batch in a single statement: rows leave the outbox and land
+# in audit_logs in the same transaction, so each entry is written once.
+# actor_id is resolved against users because actors may have been
+# deleted since the entry was queued (audit_logs.actor_id is SET NULL).
+_MOVE_TO_AUDIT_LOGS = text(f"""
+WITH batch AS (
+    DELETE FROM audit_outbox
+    WHERE id IN ({_CLAIM})
+    RETURNING {_COLUMNS}
+)
+INSERT INTO audit_logs ({_COLUMNS}, updated_at)
+SELECT
+    batch.id, batch.created_at, batch.tenant_id,
+    (SELECT users.id FROM users WHERE users.id = batch.actor_id),
+    batch.action, batch.resource_type, batch.resource_id,
+    batch.ip_address, batch.user_agent, batch.payload, batch.created_at
+FROM batch
+""")
+
+_SELECT_BATCH = text(
+    f"SELECT {_COLUMNS} FROM audit_outbox WHERE id IN ({_CLAIM}) ORDER BY id"
+)
+_DELETE_BATCH = text("DELETE FROM audit_outbox WHERE id = ANY(:ids)")
+
+
+class AuditOutboxRelay:
+    """
+    Background relay from `audit_outbox` to the audit sink.
+
+    Each batch claims rows with FOR UPDATE SKIP LOCKED, so any number of
+    relays (on any number of nodes) can run side by side on disjoint
+    batches without coordination. Full batches are relayed back to back;
+    otherwise the relay polls every `poll_interval_seconds`.
+
+    Sinks:
+    - "database": move rows into audit_logs in one statement (exactly once).
+    - "file": append NDJSON to `file_path` and fsync before deleting the
+      rows. A crash between the two can repeat a batch, so consumers
+      should de-duplicate on `id`.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: str,
+        batch_size: int,
+        poll_interval_seconds: float,
+        file_path: str,
+    ):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.file_path = file_path
+
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.relayed = 0
+        self.batches = 0
+        self.failures = 0
+
+    def _append(self, rows) -> None:
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.file_path, "a", encoding="utf-8") as sink:
+            for row in rows:
+                sink.write(json.dumps(dict(row._mapping), default=str) + "\n")
+            sink.flush()
+            os.fsync(sink.fileno())
+
+    async def relay_batch(self) -> int:
+        """Relays up to `batch_size` rows; returns how many were moved."""
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                if self.sink == "database":
+                    result = await session.execute(_MOVE_TO_AUDIT_LOGS, {"limit": self.batch_size})
+                    moved = result.rowcount
+                else:
+                    rows = (await session.execute(_SELECT_BATCH, {"limit": self.batch_size})).all()
+                    if rows:
+                        await asyncio.to_thread(self._append, rows)
+                        await session.execute(_DELETE_BATCH, {"ids": [row.id for row in rows]})
+                    moved = len(rows)
+
+        if moved:
+            self.relayed += moved
+            self.batches += 1
+        return moved
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                moved = await self.relay_batch()
+            except Exception:
+                self.failures += 1
+                logger.exception("Audit outbox relay batch failed")
+                moved = 0
+
+            if moved < self.batch_size:
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Let a batch in flight commit; whatever is left stays in the
+        # outbox for the next relay
+        if self._task is not None:
+            self._stopping = True
+            try:
+                await asyncio.wait_for(self._task, timeout=self.poll_interval_seconds + 5)
+            except asyncio.TimeoutError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sink": self.sink,
+            "relayed": self.relayed,
+            "batches": self.batches,
+            "failures": self.failures,
+        }
+
+
+audit_outbox_relay = AuditOutboxRelay(
+    sink=settings.AUDIT_OUTBOX_SINK,
+    batch_size=settings.AUDIT_OUTBOX_BATCH_SIZE,
+    poll_interval_seconds=settings.AUDIT_OUTBOX_POLL_MS / 1000,
+    file_path=settings.AUDIT_OUTBOX_FILE_PATH,
+)
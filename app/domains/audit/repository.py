@@ -1,8 +1,15 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 from app.domains.shared.repository import BaseRepository
-from app.infrastructure.db.models.audit import AuditLog
+from app.domains.shared.keyset import Keyset
+from app.infrastructure.db.models.audit import AuditLog, AuditOutbox
 from uuid import UUID
 
+# Listing pages newest first; exports run oldest first
+AUDIT_LIST_ORDER = Keyset(AuditLog.created_at, AuditLog.id, descending=True)
+AUDIT_EXPORT_ORDER = Keyset(AuditLog.created_at, AuditLog.id, descending=False)
+
 
 class AuditLogRepository(BaseRepository[AuditLog]):
     def __init__(self, session: AsyncSession):
@@ -34,3 +41,93 @@ class AuditLogRepository(BaseRepository[AuditLog]):
         self.session.add(audit_log)
         await self.session.flush()  # 🔴 NO commit here
         return audit_log
+
+    def enqueue(self, **fields) -> AuditOutbox:
+        """
+        Adds an outbox entry to the current transaction.
+        Not flushed: the INSERT goes out with the request's commit.
+        """
+        entry = AuditOutbox(**fields)
+        self.session.add(entry)
+        return entry
+
+    def _filtered(
+        self,
+        *,
+        tenant_id: UUID | None = None,
+        actor_id: UUID | None = None,
+        action: str | None = None,
+        resource_type: str | None = None,
+        resource_id: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        payload_contains: dict | None = None,
+    ) -> Select:
+        query = select(self.model)
+
+        # 🔍 Filtering
+        if tenant_id:
+            query = query.where(self.model.tenant_id == tenant_id)
+        if actor_id:
+            query = query.where(self.model.actor_id == actor_id)
+        if action:
+            query = query.where(self.model.action == action)
+        if resource_type:
+            query = query.where(self.model.resource_type == resource_type)
+        if resource_id:
+            query = query.where(self.model.resource_id == resource_id)
+        if created_after:
+            query = query.where(self.model.created_at >= created_after)
+        if created_before:
+            query = query.where(self.model.created_at < created_before)
+        if payload_contains:
+            # @> is served by the GIN (jsonb_path_ops) index ix_audit_logs_payload
+            query = query.where(self.model.payload.contains(payload_contains))
+        return query
+
+    def keyset_query(
+        self,
+        *,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        **filters,
+    ) -> Select:
+        """
+        Newest-first page of at most `limit` entries, strictly after the
+        (created_at, id) position `after`.
+
+        Keyset instead of OFFSET: every page is a range scan of an
+        ix_audit_logs_* (..., created_at, id) index that stops after
+        `limit` rows, however deep the client has paged. No count is taken.
+        """
+        return AUDIT_LIST_ORDER.apply(self._filtered(**filters), after=after, limit=limit)
+
+    async def list_keyset(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        **filters,
+    ) -> tuple[list[AuditLog], str | None]:
+        return await self.paginate_keyset(
+            self._filtered(**filters),
+            keyset=AUDIT_LIST_ORDER,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def stream_keyset(
+        self,
+        *,
+        batch_size: int,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int | None = None,
+        **filters,
+    ) -> AsyncScalarResult[AuditLog]:
+        """
+        Oldest-first entries after `after`, read through a server-side
+        cursor `batch_size` rows at a time. Must be consumed inside a
+        transaction; only one batch is held in memory.
+        """
+        query = AUDIT_EXPORT_ORDER.apply(self._filtered(**filters), after=after, limit=limit)
+        return await self.session.stream_scalars(query, execution_options={"yield_per": batch_size})
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, IPvAnyAddress
 from uuid import UUID
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Literal
 
 
 class AuditLogCreate(BaseModel):
@@ -10,3 +11,54 @@ class AuditLogCreate(BaseModel):
     payload: Optional[Dict] = None
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
+
+
+class AuditLogFilterParams(BaseModel):
+    """
+    `payload_contains` is a JSON object matched by containment against
+    the entry's payload, e.g. ?payload_contains={"email": "jane@acme.io"}
+    """
+    tenant_id: Optional[UUID] = None
+    actor_id: Optional[UUID] = None
+    action: Optional[str] = None
+    resource_type: Optional[str] = None
+    resource_id: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    payload_contains: Optional[str] = None
+
+
+class AuditLogListParams(AuditLogFilterParams):
+    """
+    Query parameters:
+        ?limit=50&cursor=<next_cursor>&actor_id=...&action=...
+    Results are newest first; pass `pagination.next_cursor` back to get the next page.
+    """
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: Optional[str] = None
+
+
+class AuditLogExportParams(AuditLogFilterParams):
+    """
+    Query parameters:
+        ?format=csv&created_after=...&cursor=<cursor of the last row received>
+    Results are oldest first. Every exported row carries its own `cursor`,
+    so an interrupted export resumes right after the last row received.
+    """
+    format: Literal["ndjson", "csv"] = "ndjson"
+    cursor: Optional[str] = None
+
+
+class AuditLogSchema(BaseModel):
+    id: UUID
+    created_at: datetime
+    tenant_id: Optional[UUID] = None
+    actor_id: Optional[UUID] = None
+    action: str
+    resource_type: str
+    resource_id: Optional[str] = None
+    ip_address: Optional[IPvAnyAddress] = None
+    user_agent: Optional[str] = None
+    payload: Optional[Dict] = None
+
+    model_config = ConfigDict(from_attributes=True)
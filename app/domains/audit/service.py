@@ -1,8 +1,23 @@
+import json
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
-from app.domains.audit.repository import AuditLogRepository
-from app.domains.audit.schemas import AuditLogCreate
+from app.domains.audit.repository import AUDIT_EXPORT_ORDER, AuditLogRepository
+from app.domains.audit.export import ExportStream, audit_exporter
+from app.domains.audit.schemas import (
+    AuditLogCreate,
+    AuditLogExportParams,
+    AuditLogFilterParams,
+    AuditLogListParams,
+    AuditLogSchema,
+)
+from app.domains.shared.schemas.pagination import PaginatedData, PaginationMeta
+from app.domains.audit.writer import audit_writer
+from app.core.config import settings
+from app.core.exceptions import InvalidQuery
+from app.infrastructure.db.mixins import uuid7_uuid
+from app.infrastructure.db.session import on_commit
 
 
 def _json_safe(value):
@@ -16,8 +31,22 @@ def _json_safe(value):
         return {k: _json_safe(v) for k, v in value.items()}
     return value
 
+
+def _payload_filter(value: str | None) -> dict | None:
+    if value is None:
+        return None
+    try:
+        payload = json.loads(value)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        raise InvalidQuery("payload_contains must be a JSON object")
+    return payload
+
 class AuditService:
-    def __init__(self, audit_repo: AuditLogRepository):
+    # Exports read through their own sessions (see AuditExporter), so the
+    # service can be built without a request-scoped repository for them
+    def __init__(self, audit_repo: Optional[AuditLogRepository] = None):
         self.audit_repo = audit_repo
 
     async def log_action(
@@ -30,6 +59,39 @@ class AuditService:
         
         payload = _json_safe(data.payload) if data.payload else None
 
+        # Outbox mode: committed atomically with the business change,
+        # delivered to audit_logs by AuditOutboxRelay
+        if settings.AUDIT_WRITE_MODE == "outbox":
+            self.audit_repo.enqueue(
+                tenant_id=tenant_id,
+                actor_id=actor_id,
+                action=data.action,
+                resource_type=data.resource_type,
+                resource_id=data.resource_id,
+                ip_address=data.ip_address,
+                user_agent=data.user_agent,
+                payload=payload,
+            )
+            return
+
+        # Buffered mode: queued once the business change is committed.
+        # Timestamped now, so entries keep the time of the action.
+        if audit_writer.has_capacity():
+            row = dict(
+                id=uuid7_uuid(),
+                created_at=datetime.now(timezone.utc),
+                tenant_id=tenant_id,
+                actor_id=actor_id,
+                action=data.action,
+                resource_type=data.resource_type,
+                resource_id=data.resource_id,
+                ip_address=data.ip_address,
+                user_agent=data.user_agent,
+                payload=payload,
+            )
+            on_commit(self.audit_repo.session, lambda: audit_writer.submit(row))
+            return
+
         await self.audit_repo.create(
             tenant_id=tenant_id,
             actor_id=actor_id,
@@ -40,3 +102,56 @@ class AuditService:
             user_agent=data.user_agent,
             payload=payload,
         )
+
+    def _filters(self, actor, params: AuditLogFilterParams) -> dict:
+        # 🔐 Tenant users only ever see their own tenant's trail
+        tenant_id = params.tenant_id if actor.tenant_id is None else actor.tenant_id
+
+        return dict(
+            tenant_id=tenant_id,
+            actor_id=params.actor_id,
+            action=params.action,
+            resource_type=params.resource_type,
+            resource_id=params.resource_id,
+            created_after=params.created_after,
+            created_before=params.created_before,
+            payload_contains=_payload_filter(params.payload_contains),
+        )
+
+    async def list_logs(
+        self,
+        *,
+        actor,
+        params: AuditLogListParams,
+    ) -> PaginatedData[AuditLogSchema]:
+        logs, next_cursor = await self.audit_repo.list_keyset(
+            limit=params.limit,
+            cursor=params.cursor,
+            **self._filters(actor, params),
+        )
+
+        return PaginatedData(
+            items=[AuditLogSchema.model_validate(log) for log in logs],
+            pagination=PaginationMeta.for_cursor(
+                page_size=params.limit,
+                cursor=params.cursor,
+                next_cursor=next_cursor,
+            ),
+        )
+
+    async def export_logs(
+        self,
+        *,
+        actor,
+        params: AuditLogExportParams,
+    ) -> ExportStream:
+        """
+        Starts a streaming export. Scope, cursor and capacity are checked
+        here, before the response starts, so failures still get a proper
+        error status.
+        """
+        return await audit_exporter.open(
+            format=params.format,
+            after=AUDIT_EXPORT_ORDER.decode(params.cursor) if params.cursor else None,
+            filters=self._filters(actor, params),
+        )
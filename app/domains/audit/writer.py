@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.db.models.audit import AuditLog
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+class AuditWriter:
+    """
+    Buffered audit pipeline: entries are queued in memory and a background
+    task bulk-inserts them (multi-row INSERT) every `flush_interval_seconds`,
+    or as soon as `flush_size` entries are waiting.
+
+    Durability:
+    - AuditService only queues an entry if there is room, and only after
+      the request transaction commits; otherwise it writes it inside the
+      request transaction as before. Room is checked again on submit
+      (other requests may have filled the buffer since, or shutdown
+      begun): an entry that cannot be queued is inserted right away.
+    - A batch that cannot be inserted is appended to `spill_path` (NDJSON)
+      instead of being dropped.
+    - stop() drains the queue on shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        flush_size: int,
+        flush_interval_seconds: float,
+        spill_path: str,
+    ):
+        self.max_size = max_size
+        self.flush_size = flush_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.spill_path = spill_path
+
+        self._pending: List[Dict[str, Any]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.written = 0
+        self.spilled = 0
+        self.batches = 0
+        self.overflowed = 0
+
+    def has_capacity(self) -> bool:
+        return self._task is not None and not self._stopping and len(self._pending) < self.max_size
+
+    async def submit(self, row: Dict[str, Any]) -> None:
+        """Queues a committed audit entry. Meant to be registered with on_commit()."""
+        if not self.has_capacity():
+            # Full, or stopping (the queue may already be drained)
+            self.overflowed += 1
+            await self._persist([row])
+            return
+
+        self._pending.append(row)
+        if len(self._pending) >= self.flush_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(AuditLog.__table__), rows)
+            await session.commit()
+
+    def _spill(self, rows: List[Dict[str, Any]]) -> None:
+        def encode(value):
+            if isinstance(value, (UUID, datetime)):
+                return str(value)
+            raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as spill:
+            for row in rows:
+                spill.write(json.dumps(row, default=encode) + "\n")
+            spill.flush()
+            os.fsync(spill.fileno())
+
+    async def _persist(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            await self._insert(rows)
+            self.written += len(rows)
+            self.batches += 1
+        except Exception:
+            logger.exception(f"Audit batch of {len(rows)} failed, spilling to {self.spill_path}")
+            try:
+                self._spill(rows)
+                self.spilled += len(rows)
+            except Exception:
+                logger.exception(f"Could not spill audit batch: {rows}")
+
+    async def flush(self) -> None:
+        while self._pending:
+            rows = self._pending[:self.flush_size]
+            del self._pending[:self.flush_size]
+            await self._persist(rows)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Not cancelled: a batch in flight must finish (or spill)
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "batches": self.batches,
+            "spilled": self.spilled,
+            "overflowed": self.overflowed,
+        }
+
+
+audit_writer = AuditWriter(
+    max_size=settings.AUDIT_BUFFER_MAX_SIZE,
+    flush_size=settings.AUDIT_FLUSH_SIZE,
+    flush_interval_seconds=settings.AUDIT_FLUSH_INTERVAL_MS / 1000,
+    spill_path=settings.AUDIT_SPILL_PATH,
+)
@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, LargeBinary, Uuid, exists, func, insert, literal, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains.shared.repository import BaseRepository
+from app.infrastructure.db.models.refresh_token import RefreshToken
+from app.infrastructure.db.models.user import User
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(RefreshToken, session)
+
+    async def rotate(
+        self,
+        *,
+        token_id: Optional[UUID],
+        token_hash: bytes,
+        new_id: UUID,
+        new_token_hash: bytes,
+        new_expires_at: datetime,
+    ) -> Optional[Row]:
+        """
+        Revokes the presented token and inserts its successor in a
+        single statement (data-modifying CTEs):
+
+            target   -> the presented token joined to its user
+            rotated  -> UPDATE ... WHERE revoked_at IS NULL RETURNING id
+            inserted -> INSERT the successor only if `rotated` matched
+
+        Concurrent rotations of the same token serialize on the row lock;
+        the losers re-check `revoked_at IS NULL`, match nothing and get
+        `rotated = false`, exactly like a replay.
+
+        `token_id` is None for legacy tokens, which are matched on the
+        digest alone through the unique index. Comparing digests in SQL
+        leaks nothing useful: timing can at most reveal a prefix of a
+        SHA-256 digest, not of the secret.
+
+        Returns None if no token matches, otherwise a row with the
+        owner's user_id / tenant_id / role_id / user_status and the
+        flags `revoked`, `expired` and `rotated`.
+        """
+        now = func.now()
+        tokens = self.model.__table__
+
+        match = [tokens.c.token_hash == token_hash]
+        if token_id is not None:
+            match.append(tokens.c.id == token_id)
+
+        target = (
+            select(
+                tokens.c.id,
+                tokens.c.user_id,
+                tokens.c.tenant_id,
+                tokens.c.revoked_at,
+                tokens.c.replaced_by,
+                tokens.c.expires_at,
+                User.role_id,
+                User.user_status,
+            )
+            .join(User, User.id == tokens.c.user_id)
+            .where(*match)
+            .cte("target")
+        )
+
+        rotated = (
+            update(tokens)
+            .where(
+                tokens.c.id == target.c.id,
+                tokens.c.revoked_at.is_(None),
+                tokens.c.replaced_by.is_(None),
+                tokens.c.expires_at > now,
+                target.c.user_status == "active",
+            )
+            .values(revoked_at=now, replaced_by=new_id, updated_at=now)
+            .returning(tokens.c.id)
+            .cte("rotated")
+        )
+
+        inserted = (
+            insert(tokens)
+            .from_select(
+                ["id", "user_id", "tenant_id", "token_hash", "expires_at"],
+                select(
+                    literal(new_id, Uuid),
+                    target.c.user_id,
+                    target.c.tenant_id,
+                    literal(new_token_hash, LargeBinary),
+                    literal(new_expires_at, DateTime(timezone=True)),
+                ).where(exists(select(rotated.c.id))),
+            )
+            .returning(tokens.c.id)
+            .cte("inserted")
+        )
+
+        query = select(
+            target.c.user_id,
+            target.c.tenant_id,
+            target.c.role_id,
+            target.c.user_status,
+            (target.c.revoked_at.is_not(None) | target.c.replaced_by.is_not(None)).label("revoked"),
+            (target.c.expires_at <= now).label("expired"),
+            exists(select(inserted.c.id)).label("rotated"),
+        )
+
+        return (await self.session.execute(query)).one_or_none()
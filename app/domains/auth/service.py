@@ -1,28 +1,51 @@
 import uuid
 import secrets
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
-from app.security.hashing import verify_password
+from app.security.hashing import hash_password_async, needs_rehash, verify_password_async
 from app.security.tokens import create_jwt_token
+from app.security.refresh_tokens import (
+    generate_refresh_token,
+    hash_refresh_secret,
+    parse_refresh_token,
+    verify_refresh_secret,
+)
 from app.domains.users.repository import UserRepository
 from app.domains.auth.otp_repository import OTPRepository
+from app.domains.auth.repository import RefreshTokenRepository
+from app.domains.auth.session_store import session_store
+from app.domains.users.projections import AuthenticatedUser
+from app.domains.users.cache import user_security_versions
+from app.domains.rbac.roles.cache import role_permission_cache
 from app.infrastructure.db.models.refresh_token import RefreshToken
 from app.infrastructure.db.models.login_attempt import LoginAttempt
+from app.infrastructure.db.mixins import uuid7_uuid
 from app.core.config import settings
 from app.core.exceptions import AuthenticationError, InvalidCredentials
 from sqlalchemy import select, update
 from app.core.rate_limiter import RateLimiter
+from app.core.admission import AdmissionController
 
 from app.core.logging import setup_logging, get_logger
 
 setup_logging()
 logger = get_logger(__name__)
 
+# Process-wide cap on concurrent Argon2 verifications during login
+login_admission = AdmissionController(
+    "login",
+    max_concurrent=settings.LOGIN_MAX_CONCURRENT_VERIFICATIONS,
+    max_queue=settings.LOGIN_MAX_QUEUE,
+    queue_timeout_seconds=settings.LOGIN_QUEUE_TIMEOUT_MS / 1000,
+)
+
 class AuthService:
     def __init__(self, user_repo: UserRepository, otp_repo: OTPRepository):
             self.user_repo = user_repo
             self.otp_repo = otp_repo
+            self.refresh_repo = RefreshTokenRepository(user_repo.session)
             # Initialize the limiter for OTP requests
             self.otp_limiter = RateLimiter(
                 key_prefix="otp_req", 
@@ -50,11 +73,13 @@ class AuthService:
         # 1. & 2. Verify existence and password
         # We use a single check to prevent 'User Enumeration' attacks
         is_valid = False
+        pwd_method = None
         if user and user.auth_methods:
             # Find the password auth method
             pwd_method = next((m for m in user.auth_methods if m.auth_type == "password"), None)
             if pwd_method and pwd_method.password_hash:
-                is_valid = verify_password(password, pwd_method.password_hash)
+                async with login_admission.slot():
+                    is_valid = await verify_password_async(password, pwd_method.password_hash)
 
         # 3. Security Audit Logging
         await self._create_login_attempt(
@@ -73,12 +98,13 @@ class AuthService:
         if not user.user_status == "active" or (user.tenant and not user.tenant.tenant_status == "active"):
             raise AuthenticationError("Account or Organization is inactive")
 
+        # Upgrade hashes created with outdated Argon2 parameters.
+        # Flushed with the rest of the login transaction.
+        if needs_rehash(pwd_method.password_hash):
+            pwd_method.password_hash = await hash_password_async(password)
+
         # 5. Token Generation
-        access_token = create_jwt_token(
-            subject=user.id, 
-            tenant_id=user.tenant_id,
-            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        )
+        access_token = await self._issue_access_token(user)
 
         
         refresh_token_str = await self._issue_refresh_token(user)
@@ -91,48 +117,78 @@ class AuthService:
         """
         Validates a refresh token and issues a new pair (Access + Refresh).
         Implements token rotation and replay detection.
+
+        Rotation is a single atomic statement (see RefreshTokenRepository.rotate,
+        or the Lua script of the Redis session store): of any number of
+        concurrent refreshes with the same token, exactly one succeeds and
+        the others are treated as replays.
         """
-        # 1. Find the token in the database
-        # In production, you would hash the incoming string before querying
-        query = select(RefreshToken).where(RefreshToken.token_hash == refresh_token_str)
-        result = await self.user_repo.session.execute(query)
-        db_token = result.scalar_one_or_none()
+        parsed = parse_refresh_token(refresh_token_str)
+        token_id, secret = parsed if parsed else (None, refresh_token_str)
+
+        new_id = uuid7_uuid()
+        new_refresh_token_str, new_token_hash = generate_refresh_token(new_id)
+
+        rotation = dict(
+            token_id=token_id,
+            token_hash=hash_refresh_secret(secret),
+            new_id=new_id,
+            new_token_hash=new_token_hash,
+            new_expires_at=datetime.now(timezone.utc)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
 
-        if not db_token:
+        # 1. Revoke the presented token and insert its successor.
+        # Sessions missing from Redis (e.g. issued before the store was
+        # enabled) are still served from the database.
+        result = None
+        if session_store is not None and token_id is not None:
+            result = await session_store.rotate(**rotation)
+            if result is not None:
+                # Redis sessions only know their owner; take role and status
+                # from the user row, as the database path does
+                user = await self.user_repo.get_auth_projection(user_id=result.user_id)
+                result = replace(
+                    result,
+                    role_id=user.role_id if user else None,
+                    user_status=user.user_status if user else None,
+                )
+        if result is None:
+            result = await self.refresh_repo.rotate(**rotation)
+
+        if result is None:
             raise InvalidCredentials("Invalid refresh token")
 
-        # 2. Security Check: Replay Detection
-        if db_token.revoked_at or db_token.replaced_by:
-            # Potential attack: Revoke ALL tokens for this user for safety
-            await self._revoke_all_user_tokens(db_token.user_id)
+        if not result.rotated:
+            if not result.revoked:
+                if result.expired:
+                    raise AuthenticationError("Refresh token has expired")
+                if result.user_status != "active":
+                    raise AuthenticationError("User is inactive or not found")
+
+            # 2. Security Check: Replay Detection
+            # Already revoked, or a concurrent request rotated it first.
+            # Potential attack: Revoke ALL tokens for this user for safety.
+            # Committed here because raising rolls the request back.
+            await self._revoke_all_user_tokens(result.user_id)
+            await self.user_repo.session.commit()
             raise AuthenticationError("Security alert: Refresh token has already been used")
 
-        if db_token.expires_at < datetime.now(timezone.utc):
-            raise AuthenticationError("Refresh token has expired")
-
-        # 3. Fetch the user (ensure they are still active)
-        user = await self.user_repo.get_by_id(db_token.user_id)
-        if not user or user.user_status != "active":
+        if result.user_status != "active":
+            # Only reachable in Redis mode (the database path does not rotate
+            # for inactive users): end the session that was just rotated in
+            await self._revoke_all_user_tokens(result.user_id)
             raise AuthenticationError("User is inactive or not found")
 
-        # 4. Generate New Tokens
-        new_access_token = create_jwt_token(
-            subject=user.id,
-            tenant_id=user.tenant_id,
-            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        # 3. Issue the access token for the rotated session
+        user = AuthenticatedUser(
+            id=result.user_id,
+            user_status=result.user_status,
+            tenant_id=result.tenant_id,
+            role_id=result.role_id,
+            role=None,
         )
-
-        
-        # 5. Rotate: Issue new refresh token and link the old one
-        new_refresh_token_str = await self._issue_refresh_token(user)
-        
-        # Update old token metadata
-        db_token.replaced_by = new_refresh_token_str.id
-        db_token.revoked_at = datetime.now(timezone.utc)
-        # Note: You'll need the ID of the new token to set replaced_by
-        # This requires looking up the token we just created in _issue_refresh_token
-        
-        # await self.user_repo.session.commit()
+        new_access_token = await self._issue_access_token(user)
 
         return new_access_token, new_refresh_token_str
     
@@ -140,10 +196,11 @@ class AuthService:
         """
         Revokes a specific refresh token to end a session.
         """
+        if await self._revoke_in_session_store(refresh_token_str):
+            return
+
         # 1. Find the token
-        query = select(RefreshToken).where(RefreshToken.token_hash == refresh_token_str)
-        result = await self.user_repo.session.execute(query)
-        db_token = result.scalar_one_or_none()
+        db_token = await self._get_refresh_token(refresh_token_str)
 
         if not db_token:
             return
@@ -153,6 +210,11 @@ class AuthService:
 
     async def _revoke_all_user_tokens(self, user_id: uuid.UUID):
         """Safety mechanism for suspected breaches."""
+        if session_store is not None:
+            # O(1); the database rows are revoked by the write-behind
+            await session_store.revoke_all(user_id)
+            return
+
         stmt = (
             update(RefreshToken)
             .where(RefreshToken.user_id == user_id)
@@ -161,15 +223,83 @@ class AuthService:
         await self.user_repo.session.execute(stmt)
         # await self.user_repo.session.commit()
 
+    async def _issue_access_token(self, user) -> str:
+        """
+        Signs an access token carrying the user's role and the current
+        role/user security versions, so requests can be authorized
+        without a DB round trip while neither version has moved.
+        If Redis is unavailable the version claims are left out and
+        the token is always checked against the database.
+        """
+        claims = {}
+        try:
+            claims["uv"] = await user_security_versions.issue(user.id)
+            if user.role_id is not None:
+                claims["role_id"] = str(user.role_id)
+                claims["rv"] = await role_permission_cache.current_version(user.role_id)
+        except Exception:
+            logger.warning("Security version lookup failed, issuing token without version claims", exc_info=True)
+            claims = {}
+
+        return create_jwt_token(
+            subject=user.id,
+            tenant_id=user.tenant_id,
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            claims=claims,
+        )
+
+    async def _get_refresh_token(self, refresh_token_str: str) -> Optional[RefreshToken]:
+        """
+        Resolves a presented refresh token to its row.
+        `<id>.<secret>` tokens are a primary-key fetch plus a constant-time
+        digest compare; legacy bare-UUID tokens go through the unique
+        hash index.
+        """
+        session = self.user_repo.session
+        parsed = parse_refresh_token(refresh_token_str)
+
+        if parsed is None:
+            query = select(RefreshToken).where(
+                RefreshToken.token_hash == hash_refresh_secret(refresh_token_str)
+            )
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
+
+        token_id, secret = parsed
+        db_token = await session.get(RefreshToken, token_id)
+        if db_token is None or not verify_refresh_secret(secret, db_token.token_hash):
+            return None
+        return db_token
+
+    async def _revoke_in_session_store(self, refresh_token_str: str) -> bool:
+        """True if the token was a Redis session and is now revoked."""
+        parsed = parse_refresh_token(refresh_token_str)
+        if session_store is None or parsed is None:
+            return False
+
+        token_id, secret = parsed
+        return await session_store.revoke(token_id=token_id, token_hash=hash_refresh_secret(secret))
+
     async def _issue_refresh_token(self, user) -> str:
-        token_str = str(uuid.uuid4())
+        token_id = uuid7_uuid()
+        token_str, token_hash = generate_refresh_token(token_id)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+        if session_store is not None:
+            await session_store.issue(
+                user=user,
+                token_id=token_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+            return token_str
 
         new_token = RefreshToken(
+            id=token_id,
             user_id=user.id,
             tenant_id=user.tenant_id,
-            token_hash=token_str,
-            expires_at=datetime.now(timezone.utc)
-            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            token_hash=token_hash,
+            expires_at=expires_at,
         )
 
         self.user_repo.session.add(new_token)
@@ -188,10 +318,11 @@ class AuthService:
         Revokes a specific refresh token to end a session.
         Matches the call in the API route.
         """
+        if await self._revoke_in_session_store(refresh_token_str):
+            return
+
         # 1. Find the token
-        query = select(RefreshToken).where(RefreshToken.token_hash == refresh_token_str)
-        result = await self.user_repo.session.execute(query)
-        db_token = result.scalar_one_or_none()
+        db_token = await self._get_refresh_token(refresh_token_str)
 
         if not db_token:
             # If the token doesn't exist, the session is already invalid
@@ -239,11 +370,7 @@ class AuthService:
         await self.otp_repo.delete_otp(email)
 
         # 4. Standard Token Issuance
-        access_token = create_jwt_token(
-            subject=user.id,
-            tenant_id=user.tenant_id,
-            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        )
+        access_token = await self._issue_access_token(user)
         
         refresh_token_str = await self._issue_refresh_token(user)
         return access_token, refresh_token_str
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.clients.redis_client import redis_client
+from app.infrastructure.db.models.refresh_token import RefreshToken
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRotation:
+    """
+    Same shape as the row returned by RefreshTokenRepository.rotate.
+    Sessions only record their owner: role_id and user_status are left
+    unset here and read from the user row by AuthService, so a role
+    change or deactivation is seen on the next refresh.
+    """
+    user_id: UUID
+    tenant_id: Optional[UUID]
+    revoked: bool
+    expired: bool
+    rotated: bool
+    role_id: Optional[UUID] = None
+    user_status: Optional[str] = None
+
+
+# KEYS: old session, new session, owner's generation counter
+# ARGV: token hash, new id, new hash, ttl seconds, now, new expires_at
+_ROTATE_SCRIPT = """
+local fields = redis.call('HGETALL', KEYS[1])
+if #fields == 0 then return {'missing'} end
+local s = {}
+for i = 1, #fields, 2 do s[fields[i]] = fields[i + 1] end
+if s.token_hash ~= ARGV[1] then return {'missing'} end
+
+local owner = {s.user_id, s.tenant_id}
+local gen = redis.call('GET', KEYS[3]) or '0'
+if s.revoked == '1' or s.gen ~= gen then
+    return {'revoked', unpack(owner)}
+end
+if tonumber(s.expires_at) <= tonumber(ARGV[5]) then
+    return {'expired', unpack(owner)}
+end
+
+redis.call('HSET', KEYS[1], 'revoked', '1', 'replaced_by', ARGV[2])
+redis.call('HSET', KEYS[2],
+    'user_id', s.user_id, 'tenant_id', s.tenant_id,
+    'token_hash', ARGV[3], 'expires_at', ARGV[6], 'gen', gen, 'revoked', '0')
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return {'rotated', unpack(owner)}
+"""
+
+# KEYS: session
+# ARGV: token hash
+# Only marks an existing hash, so its TTL is kept and an expired session
+# is never recreated as a key without one
+_REVOKE_SCRIPT = """
+local stored = redis.call('HGET', KEYS[1], 'token_hash')
+if not stored or stored ~= ARGV[1] then return 0 end
+redis.call('HSET', KEYS[1], 'revoked', '1')
+return 1
+"""
+
+
+class SessionPersister:
+    """
+    Write-behind of session changes to `refresh_tokens`, for audit.
+
+    Events are queued in order and flushed every `batch_interval_seconds`
+    in their own transaction. Consecutive events of the same kind are
+    coalesced into one statement, so a batch costs a handful of round
+    trips no matter how many refreshes it covers.
+
+    A failed batch stays at the head of the queue (events must apply in
+    order) and is retried on the next flush. After `max_retries`
+    consecutive failures, or on shutdown, it is appended to `spill_path`
+    (NDJSON) instead of being dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_interval_seconds: float,
+        max_batch_size: int,
+        max_retries: int,
+        spill_path: str,
+    ):
+        self.batch_interval_seconds = batch_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.spill_path = spill_path
+
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._failures = 0
+
+        self.persisted = 0
+        self.failed = 0
+        self.spilled = 0
+
+    def record(self, kind: str, values: Dict[str, Any]) -> None:
+        self._pending.append((kind, values))
+
+    async def _write(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        tokens = RefreshToken.__table__
+        statements = {
+            "issue": insert(tokens).on_conflict_do_nothing(index_elements=["id"]),
+            "revoke": (
+                update(tokens)
+                .where(tokens.c.id == bindparam("b_id"))
+                .values(revoked_at=bindparam("b_revoked_at"), replaced_by=bindparam("b_replaced_by"))
+            ),
+            "revoke_all": (
+                update(tokens)
+                .where(tokens.c.user_id == bindparam("b_user_id"), tokens.c.revoked_at.is_(None))
+                .values(revoked_at=bindparam("b_revoked_at"))
+            ),
+        }
+
+        async with AsyncSessionLocal() as session:
+            start = 0
+            while start < len(events):
+                kind = events[start][0]
+                end = start
+                while end < len(events) and events[end][0] == kind:
+                    end += 1
+                await session.execute(statements[kind], [values for _, values in events[start:end]])
+                start = end
+            await session.commit()
+
+    def _spill(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        def encode(value):
+            if isinstance(value, (UUID, datetime)):
+                return str(value)
+            if isinstance(value, bytes):
+                return value.hex()
+            raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as spill:
+            for kind, values in events:
+                spill.write(json.dumps({"kind": kind, "values": values}, default=encode) + "\n")
+            spill.flush()
+            os.fsync(spill.fileno())
+
+    async def flush(self, *, final: bool = False) -> None:
+        while self._pending:
+            events = self._pending[:self.max_batch_size]
+            try:
+                await self._write(events)
+                self.persisted += len(events)
+                self._failures = 0
+            except Exception:
+                self.failed += 1
+                self._failures += 1
+                logger.exception(
+                    f"Failed to persist {len(events)} session events (attempt {self._failures})"
+                )
+                if not final and self._failures < self.max_retries:
+                    return
+                try:
+                    self._spill(events)
+                    self.spilled += len(events)
+                    logger.error(f"Spilled {len(events)} session events to {self.spill_path}")
+                except Exception:
+                    logger.exception(f"Could not spill session events: {events}")
+                self._failures = 0
+            del self._pending[:len(events)]
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.batch_interval_seconds)
+            await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush(final=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "persisted": self.persisted,
+            "failed_batches": self.failed,
+            "spilled": self.spilled,
+        }
+
+
+class RedisSessionStore:
+    """
+    Active refresh tokens as Redis hashes (`session:<token id>`) with
+    a native TTL of REFRESH_TOKEN_EXPIRE_DAYS.
+
+    Rotation runs as one Lua script, so it is atomic and race-free just
+    like the database path. Revoked and replaced sessions keep their
+    key until it expires, which is what makes replays detectable.
+    Revoking all sessions of a user is a single INCR of their
+    generation counter; sessions from an older generation count as
+    revoked.
+    """
+
+    def __init__(self, client: Redis, persister: SessionPersister, ttl_seconds: int):
+        self.client = client
+        self.persister = persister
+        self.ttl_seconds = ttl_seconds
+        self.prefix = "session:"
+        self.generation_prefix = "session:user_gen:"
+        self._rotate = client.register_script(_ROTATE_SCRIPT)
+        self._revoke = client.register_script(_REVOKE_SCRIPT)
+
+    def _key(self, token_id: UUID) -> str:
+        return f"{self.prefix}{token_id}"
+
+    def _generation_key(self, user_id: UUID) -> str:
+        return f"{self.generation_prefix}{user_id}"
+
+    async def issue(self, *, user, token_id: UUID, token_hash: bytes, expires_at: datetime) -> None:
+        generation = await self.client.get(self._generation_key(user.id)) or "0"
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(token_id), mapping={
+                "user_id": str(user.id),
+                "tenant_id": str(user.tenant_id) if user.tenant_id else "",
+                "token_hash": token_hash.hex(),
+                "expires_at": int(expires_at.timestamp()),
+                "gen": generation,
+                "revoked": "0",
+            })
+            pipe.expire(self._key(token_id), self.ttl_seconds)
+            await pipe.execute()
+
+        self.persister.record("issue", {
+            "id": token_id,
+            "user_id": user.id,
+            "tenant_id": user.tenant_id,
+            "token_hash": token_hash,
+            "expires_at": expires_at,
+        })
+
+    async def rotate(
+        self,
+        *,
+        token_id: UUID,
+        token_hash: bytes,
+        new_id: UUID,
+        new_token_hash: bytes,
+        new_expires_at: datetime,
+    ) -> Optional[SessionRotation]:
+        """
+        Returns None if the session is not in Redis (unknown token or
+        one issued before the store was enabled).
+        """
+        owner_id = await self.client.hget(self._key(token_id), "user_id")
+        if owner_id is None:
+            return None
+
+        result = await self._rotate(
+            keys=[self._key(token_id), self._key(new_id), self._generation_key(owner_id)],
+            args=[
+                token_hash.hex(),
+                str(new_id),
+                new_token_hash.hex(),
+                self.ttl_seconds,
+                int(time.time()),
+                int(new_expires_at.timestamp()),
+            ],
+        )
+
+        status = result[0]
+        if status == "missing":
+            return None
+
+        user_id, tenant_id = result[1:3]
+        rotation = SessionRotation(
+            user_id=UUID(user_id),
+            tenant_id=UUID(tenant_id) if tenant_id else None,
+            revoked=status == "revoked",
+            expired=status == "expired",
+            rotated=status == "rotated",
+        )
+
+        if rotation.rotated:
+            now = datetime.now(timezone.utc)
+            self.persister.record("issue", {
+                "id": new_id,
+                "user_id": rotation.user_id,
+                "tenant_id": rotation.tenant_id,
+                "token_hash": new_token_hash,
+                "expires_at": new_expires_at,
+            })
+            self.persister.record("revoke", {
+                "b_id": token_id,
+                "b_revoked_at": now,
+                "b_replaced_by": new_id,
+            })
+
+        return rotation
+
+    async def revoke(self, *, token_id: UUID, token_hash: bytes) -> bool:
+        """Marks one session revoked. False if it is not in Redis."""
+        if not await self._revoke(keys=[self._key(token_id)], args=[token_hash.hex()]):
+            return False
+
+        self.persister.record("revoke", {
+            "b_id": token_id,
+            "b_revoked_at": datetime.now(timezone.utc),
+            "b_replaced_by": None,
+        })
+        return True
+
+    async def revoke_all(self, user_id: UUID) -> None:
+        await self.client.incr(self._generation_key(user_id))
+        self.persister.record("revoke_all", {
+            "b_user_id": user_id,
+            "b_revoked_at": datetime.now(timezone.utc),
+        })
+
+
+session_persister = SessionPersister(
+    batch_interval_seconds=settings.SESSION_PERSIST_BATCH_MS / 1000,
+    max_batch_size=settings.SESSION_PERSIST_MAX_BATCH,
+    max_retries=settings.SESSION_PERSIST_MAX_RETRIES,
+    spill_path=settings.SESSION_SPILL_PATH,
+)
+
+session_store: Optional[RedisSessionStore] = (
+    RedisSessionStore(
+        redis_client,
+        session_persister,
+        ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+    )
+    if settings.SESSION_STORE == "redis"
+    else None
+)
@@ -0,0 +1,151 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domains.rbac.roles.repository import RoleRepository
+from app.infrastructure.clients.redis_client import redis_client
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
+from app.security.permissions import CompiledPermissions, compile_permissions
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRole:
+    id: UUID
+    name: str
+    version: int
+    permissions: CompiledPermissions
+
+
+class RolePermissionCache:
+    """
+    Process-local cache of role -> compiled permissions.
+
+    Every role has a version counter in Redis that RoleService bumps
+    after committing a change. Entries are only served while their
+    version matches; the version itself is re-read from Redis at most
+    once per `staleness_seconds`, which bounds how long another worker
+    can keep using outdated permissions. The database is only hit on
+    a miss.
+
+    Both maps are LRU-bounded to `max_size` roles, so deleted or rarely
+    used (e.g. per-tenant custom) roles do not accumulate.
+    """
+
+    def __init__(self, client: Redis, staleness_seconds: float, max_size: int):
+        self.client = client
+        self.staleness_seconds = staleness_seconds
+        self.max_size = max_size
+        self.prefix = "rbac:role_version:"
+
+        self._roles: "OrderedDict[UUID, CachedRole]" = OrderedDict()
+        # role_id -> (version, monotonic time it was read)
+        self._versions: "OrderedDict[UUID, Tuple[int, float]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, entries: OrderedDict, role_id: UUID, value: Any) -> None:
+        if self.max_size > 0:
+            entries[role_id] = value
+            entries.move_to_end(role_id)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+    async def current_version(self, role_id: UUID) -> int:
+        now = time.monotonic()
+        known = self._versions.get(role_id)
+        if known and now - known[1] < self.staleness_seconds:
+            self._versions.move_to_end(role_id)
+            return known[0]
+
+        raw = await self.client.get(f"{self.prefix}{role_id}")
+        version = int(raw) if raw else 0
+        self._remember(self._versions, role_id, (version, now))
+        return version
+
+    async def get(self, session: AsyncSession, role_id: UUID) -> Optional[CachedRole]:
+        try:
+            version = await self.current_version(role_id)
+        except Exception:
+            # Without a version we cannot trust the cache; go to the DB
+            logger.warning("RBAC version lookup failed, bypassing cache", exc_info=True)
+            return await self._load(session, role_id, version=-1)
+
+        cached = self._roles.get(role_id)
+        if cached is not None and cached.version == version:
+            self._roles.move_to_end(role_id)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        role = await self._load(session, role_id, version)
+        if role is not None:
+            self._remember(self._roles, role_id, role)
+        else:
+            self._roles.pop(role_id, None)
+        return role
+
+    async def _load(self, session: AsyncSession, role_id: UUID, version: int) -> Optional[CachedRole]:
+        role = await RoleRepository(session).get_role_with_permissions(role_id)
+        if role is None:
+            return None
+
+        return CachedRole(
+            id=role.id,
+            name=role.name,
+            version=version,
+            permissions=compile_permissions(frozenset(p.slug for p in role.permissions)),
+        )
+
+    async def bump(self, role_id: UUID) -> None:
+        """
+        Publishes a new version for the role.
+        Must run after the change is committed (see on_commit).
+        """
+        version = await self.client.incr(f"{self.prefix}{role_id}")
+        self._remember(self._versions, role_id, (version, time.monotonic()))
+        self._roles.pop(role_id, None)
+
+    def invalidate(self, role_ids: List[str]) -> None:
+        """Drops entries so the next lookup re-reads the version."""
+        for role_id in role_ids:
+            key = UUID(role_id)
+            self._roles.pop(key, None)
+            self._versions.pop(key, None)
+
+    def clear(self) -> None:
+        self._roles.clear()
+        self._versions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._roles),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "staleness_seconds": self.staleness_seconds,
+        }
+
+
+role_permission_cache = RolePermissionCache(
+    client=redis_client,
+    staleness_seconds=settings.RBAC_CACHE_STALENESS_SECONDS,
+    max_size=settings.RBAC_CACHE_MAX_SIZE,
+)
+
+invalidation_bus.subscribe(
+    "role",
+    on_invalidate=role_permission_cache.invalidate,
+    on_flush=role_permission_cache.clear,
+)
@@ -2,6 +2,9 @@ from app.domains.rbac.roles.repository import RoleRepository
 from app.domains.tenants.repository import TenantRepository
 from app.domains.rbac.permissions.repository import PermissionRepository
 from app.domains.rbac.roles.schemas import RoleCreateSchema, RoleUpdateSchema, RolePermissionAttachSchema
+from app.domains.rbac.roles.cache import role_permission_cache
+from app.infrastructure.db.session import on_commit
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
 from app.infrastructure.db.models.auth_rbac import Role
 from app.core.exceptions import ResourceConflict, ResourceNotFound, AuthorizationError
 from app.core.logging import get_logger
@@ -18,6 +21,15 @@ class RoleService:
         self.permission_repo = permission_repo
         self.tenant_repo = tenant_repo
 
+    def _invalidate(self, role_id) -> None:
+        """
+        Once the transaction commits: bump the role's cache version and
+        tell other workers to drop their copy right away.
+        """
+        session = self.role_repo.session
+        on_commit(session, lambda: role_permission_cache.bump(role_id))
+        on_commit(session, lambda: invalidation_bus.publish("role", str(role_id)))
+
     async def list_roles(self, actor):
         # Super admin → see everything
         tenant_id = None if actor.tenant_id is None else actor.tenant_id
@@ -109,6 +121,7 @@ class RoleService:
             role.description = data.description
 
         await self.role_repo.session.flush()
+        self._invalidate(role.id)
         return role
     
     async def delete_role(self, *, role_id, actor):
@@ -129,6 +142,7 @@ class RoleService:
 
         role.is_active = False
         await self.role_repo.session.flush()
+        self._invalidate(role.id)
         return role
 
     async def reactivate_role(self, *, role_id, actor):
@@ -193,6 +207,7 @@ class RoleService:
 
         role.permissions.extend(new_permissions)
         await self.role_repo.session.flush()
+        self._invalidate(role.id)
 
         return role, new_permissions
 
@@ -227,5 +242,6 @@ class RoleService:
 
         role.permissions.remove(permission)
         await self.role_repo.session.flush()
+        self._invalidate(role.id)
 
         return role, permission
\ No newline at end of file
@@ -0,0 +1,156 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import Select, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.clients.redis_client import redis_client
+from app.infrastructure.db.explain import estimate_rows
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Count:
+    total: int
+    estimated: bool
+
+    def reconcile(self, *, offset: int, limit: int, fetched: int) -> "Count":
+        """
+        Makes the total agree with the page just read (`fetched` rows of a
+        `limit + 1` query): an estimate can be stale or off, the page is not.
+        """
+        if fetched > limit:
+            # At least one row beyond this page
+            return Count(max(self.total, offset + fetched), self.estimated)
+        if fetched:
+            # Last page: the total is known exactly
+            return Count(offset + fetched, False)
+        # Past the end: the total is at most `offset`
+        return Count(min(self.total, offset), self.estimated)
+
+
+class CountStrategy:
+    """
+    Total counts for offset-paginated listings, cheapest adequate method first:
+
+    1. The page itself: when it is the first and last page, its size is the total.
+    2. A cached count (Redis, `cache_ttl_seconds`), keyed by listing, tenant
+       and a hash of the filters.
+    3. Unfiltered listings of large tables: pg_class.reltuples.
+    4. A bounded exact count that stops after `exact_threshold` + 1 rows.
+    5. Beyond that, the planner's row estimate for the query (EXPLAIN).
+
+    Counts from 3 and 5 are marked as estimated. Cached counts may lag
+    writes by up to the TTL.
+    """
+
+    def __init__(self, client: Redis, *, exact_threshold: int, cache_ttl_seconds: int):
+        self.client = client
+        self.exact_threshold = exact_threshold
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.prefix = "auth:count:"
+
+        self.from_page = 0
+        self.cache_hits = 0
+        self.exact = 0
+        self.estimated_reltuples = 0
+        self.estimated_plan = 0
+
+    def _cache_key(self, table: str, tenant_id: Optional[UUID], filters: Dict[str, Any]) -> str:
+        digest = hashlib.sha256(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return f"{self.prefix}{table}:{tenant_id or 'all'}:{digest}"
+
+    async def _cached(self, key: str) -> Optional[Count]:
+        if not self.cache_ttl_seconds:
+            return None
+        try:
+            raw = await self.client.get(key)
+        except Exception:
+            logger.warning("Count cache lookup failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        total, estimated = json.loads(raw)
+        return Count(total, estimated)
+
+    async def _store(self, key: str, count: Count) -> None:
+        if not self.cache_ttl_seconds:
+            return
+        try:
+            await self.client.set(key, json.dumps([count.total, count.estimated]), ex=self.cache_ttl_seconds)
+        except Exception:
+            logger.warning("Count cache update failed", exc_info=True)
+
+    async def _compute(self, session: AsyncSession, query: Select, table: str) -> Count:
+        if query.whereclause is None:
+            reltuples = (await session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": table},
+            )).scalar_one()
+            # -1: never analyzed
+            if reltuples > self.exact_threshold:
+                self.estimated_reltuples += 1
+                return Count(reltuples, True)
+
+        rows = query.with_only_columns(literal_column("1")).order_by(None).limit(self.exact_threshold + 1)
+        bounded = (await session.execute(select(func.count()).select_from(rows.subquery()))).scalar_one()
+        if bounded <= self.exact_threshold:
+            self.exact += 1
+            return Count(bounded, False)
+
+        self.estimated_plan += 1
+        estimate = await estimate_rows(session, query.order_by(None))
+        return Count(max(estimate, bounded), True)
+
+    async def total(
+        self,
+        session: AsyncSession,
+        query: Select,
+        *,
+        table: str,
+        tenant_id: Optional[UUID],
+        filters: Dict[str, Any],
+        offset: int,
+        limit: int,
+        fetched: int,
+    ) -> Count:
+        """
+        Total for `query` (the filtered listing, without paging), given
+        that its page at `offset` returned `fetched` rows for `limit + 1`.
+        """
+        if offset == 0 and fetched <= limit:
+            self.from_page += 1
+            return Count(fetched, False)
+
+        key = self._cache_key(table, tenant_id, filters)
+        count = await self._cached(key)
+        if count is not None:
+            self.cache_hits += 1
+        else:
+            count = await self._compute(session, query, table)
+            await self._store(key, count)
+
+        return count.reconcile(offset=offset, limit=limit, fetched=fetched)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "from_page": self.from_page,
+            "cache_hits": self.cache_hits,
+            "exact": self.exact,
+            "estimated_reltuples": self.estimated_reltuples,
+            "estimated_plan": self.estimated_plan,
+        }
+
+
+count_strategy = CountStrategy(
+    redis_client,
+    exact_threshold=settings.COUNT_EXACT_THRESHOLD,
+    cache_ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+)
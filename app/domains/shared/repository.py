@@ -1,7 +1,8 @@
 from typing import Generic, TypeVar, Type, Optional, Sequence, Any
 from uuid import UUID
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import Select, select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.domains.shared.keyset import Keyset
 from app.infrastructure.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -37,4 +38,28 @@ class BaseRepository(Generic[ModelType]):
             query = query.where(self.model.tenant_id == tenant_id)
             
         result = await self.session.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+    async def paginate_keyset(
+        self,
+        query: Select,
+        *,
+        keyset: Keyset,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[Sequence[ModelType], Optional[str]]:
+        """
+        One page of `query` in `keyset` order, starting after `cursor`.
+        Returns the rows and the cursor of the next page (None on the last).
+        No count is taken.
+        """
+        after = keyset.decode(cursor) if cursor else None
+
+        # One extra row tells whether another page exists
+        query = keyset.apply(query, after=after, limit=limit + 1)
+        rows = list((await self.session.execute(query)).scalars().all())
+
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, keyset.encode(rows[-1])
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Literal, Optional, TypeVar
 from math import ceil
 
 T = TypeVar("T")
@@ -8,10 +8,19 @@ T = TypeVar("T")
 class PaginationParams(BaseModel):
     """
     Query parameters:
-        ?page=1&page_size=10
+        ?page=1&page_size=10                     (offset mode, default)
+        ?pagination=cursor&page_size=10          (cursor mode, first page)
+        ?cursor=<next_cursor>&page_size=10       (cursor mode, next pages)
+    Cursor mode skips the total count and stays fast on deep pages.
     """
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=10, ge=1, le=100)
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[str] = None
+
+    @property
+    def use_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
 
     @property
     def offset(self) -> int:
@@ -23,15 +32,29 @@ class PaginationParams(BaseModel):
 
 
 class PaginationMeta(BaseModel):
-    page: int
+    """
+    Offset mode fills page/total_*; cursor mode leaves them null and
+    sets next_cursor instead. total_estimated marks totals taken from
+    planner statistics rather than an exact count.
+    """
+    page: Optional[int] = None
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, *, page: int, page_size: int, total_items: int) -> "PaginationMeta":
+    def create(
+        cls,
+        *,
+        page: int,
+        page_size: int,
+        total_items: int,
+        total_estimated: bool = False,
+    ) -> "PaginationMeta":
         total_pages = ceil(total_items / page_size) if page_size else 0
 
         return cls(
@@ -39,10 +62,20 @@ class PaginationMeta(BaseModel):
             page_size=page_size,
             total_items=total_items,
             total_pages=total_pages,
+            total_estimated=total_estimated,
             has_next=page < total_pages,
             has_previous=page > 1,
         )
 
+    @classmethod
+    def for_cursor(cls, *, page_size: int, cursor: Optional[str], next_cursor: Optional[str]) -> "PaginationMeta":
+        return cls(
+            page_size=page_size,
+            has_next=next_cursor is not None,
+            has_previous=cursor is not None,
+            next_cursor=next_cursor,
+        )
+
 
 class PaginatedData(BaseModel, Generic[T]):
     items: List[T]
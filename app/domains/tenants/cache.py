@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.domains.tenants.repository import TenantRepository
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
+
+
+@dataclass(frozen=True, slots=True)
+class TenantSnapshot:
+    """The subset of a tenant that request authentication needs."""
+    id: UUID
+    name: str
+    tenant_status: str
+
+
+class TenantCache:
+    """
+    Process-local TTL cache of tenant snapshots.
+
+    "Not found" is cached too (with its own TTL), so tokens that point
+    at a deleted tenant cannot turn into one DB query per request.
+    Writes are propagated through the invalidation bus, so the TTL only
+    matters if an invalidation message is lost.
+    """
+
+    def __init__(self, ttl_seconds: float, negative_ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_size = max_size
+        # tenant_id -> (expires_at, snapshot or None for "not found")
+        self._entries: "OrderedDict[UUID, Tuple[float, Optional[TenantSnapshot]]]" = OrderedDict()
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    async def get(self, session: AsyncSession, tenant_id: UUID) -> Optional[TenantSnapshot]:
+        now = time.monotonic()
+        entry = self._entries.get(tenant_id)
+
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(tenant_id)
+            if entry[1] is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        tenant = await TenantRepository(session).get_by_id(tenant_id)
+
+        if tenant is None:
+            snapshot = None
+            expires_at = now + self.negative_ttl_seconds
+        else:
+            snapshot = TenantSnapshot(
+                id=tenant.id,
+                name=tenant.name,
+                tenant_status=tenant.tenant_status,
+            )
+            expires_at = now + self.ttl_seconds
+
+        if self.max_size > 0:
+            self._entries[tenant_id] = (expires_at, snapshot)
+            self._entries.move_to_end(tenant_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return snapshot
+
+    def invalidate(self, tenant_ids: List[str]) -> None:
+        for tenant_id in tenant_ids:
+            self._entries.pop(UUID(tenant_id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / total, 4) if total else 0.0,
+        }
+
+
+tenant_cache = TenantCache(
+    ttl_seconds=settings.TENANT_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=settings.TENANT_CACHE_NEGATIVE_TTL_SECONDS,
+    max_size=settings.TENANT_CACHE_MAX_SIZE,
+)
+
+invalidation_bus.subscribe(
+    "tenant",
+    on_invalidate=tenant_cache.invalidate,
+    on_flush=tenant_cache.clear,
+)
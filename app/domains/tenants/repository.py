@@ -1,10 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.sql import asc, desc
 
 from uuid import UUID
 
 from app.domains.shared.repository import BaseRepository
+from app.domains.shared.keyset import Keyset
+from app.domains.shared.counting import Count, count_strategy
 from app.infrastructure.db.models.tenant import Tenant
 
 
@@ -49,7 +51,7 @@ class TenantRepository(BaseRepository[Tenant]):
         status: str | None,
         sort_by: str,
         sort_order: str,
-    ) -> tuple[list[Tenant], int]:
+    ) -> tuple[list[Tenant], Count]:
 
         query = select(self.model)
 
@@ -61,23 +63,48 @@ class TenantRepository(BaseRepository[Tenant]):
         sort_column = getattr(self.model, sort_by)
 
         if sort_order == "asc":
-            query = query.order_by(asc(sort_column))
+            page_query = query.order_by(asc(sort_column))
         else:
-            query = query.order_by(desc(sort_column))
+            page_query = query.order_by(desc(sort_column))
+
+        # Pagination: one extra row tells whether a next page exists
+        page_query = page_query.offset(offset).limit(limit + 1)
+
+        tenants = (await self.session.execute(page_query)).scalars().all()
+
+        # Total: exact for small results, estimated (and cached) for large ones
+        total = await count_strategy.total(
+            self.session,
+            query,
+            table=self.model.__tablename__,
+            tenant_id=None,
+            filters={"status": status},
+            offset=offset,
+            limit=limit,
+            fetched=len(tenants),
+        )
 
-        # Pagination
-        query = query.offset(offset).limit(limit)
+        return tenants[:limit], total
 
-        tenants = (await self.session.execute(query)).scalars().all()
+    async def list_keyset(
+        self,
+        *,
+        limit: int,
+        cursor: str | None,
+        status: str | None,
+        sort_by: str,
+        sort_order: str,
+    ) -> tuple[list[Tenant], str | None]:
+        query = select(self.model)
 
-        # Count query
-        count_query = select(func.count()).select_from(self.model)
+        # 🔍 Filtering
         if status:
-            count_query = count_query.where(self.model.tenant_status == status)
+            query = query.where(self.model.tenant_status == status)
 
-        total = (await self.session.execute(count_query)).scalar_one()
+        # ↕ Sorting: the cursor is only valid for the order it was issued for
+        keyset = Keyset(getattr(self.model, sort_by), self.model.id, descending=sort_order == "desc")
 
-        return tenants, total
+        return await self.paginate_keyset(query, keyset=keyset, limit=limit, cursor=cursor)
     
     async def update(self, tenant: Tenant) -> Tenant:
         self.session.add(tenant)
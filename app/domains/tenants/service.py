@@ -3,11 +3,20 @@ from app.domains.tenants.schemas import TenantCreateSchema, TenantResponseSchema
 from app.domains.tenants.query_params import TenantListParams
 from app.core.exceptions import ResourceConflict, ResourceNotFound
 from app.domains.shared.schemas.pagination import PaginatedData, PaginationMeta, PaginationParams
+from app.infrastructure.db.session import on_commit
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
 
 class TenantService:
     def __init__(self, tenant_repo: TenantRepository):
         self.tenant_repo = tenant_repo
 
+    def _invalidate(self, tenant_id) -> None:
+        """Drops cached copies of the tenant on every worker after commit."""
+        on_commit(
+            self.tenant_repo.session,
+            lambda: invalidation_bus.publish("tenant", str(tenant_id)),
+        )
+
     async def create_tenant(self, data: TenantCreateSchema):
         existing = await self.tenant_repo.get_by_name(data.name)
         if existing:
@@ -21,25 +30,39 @@ class TenantService:
         params: TenantListParams,
     ) -> PaginatedData[TenantResponseSchema]:
 
-        tenants, total = await self.tenant_repo.list_paginated(
-            offset=params.offset,
-            limit=params.limit,
-            status=params.status,
-            sort_by=params.sort_by,
-            sort_order=params.sort_order,
-        )
+        if params.use_cursor:
+            tenants, next_cursor = await self.tenant_repo.list_keyset(
+                limit=params.limit,
+                cursor=params.cursor,
+                status=params.status,
+                sort_by=params.sort_by,
+                sort_order=params.sort_order,
+            )
+            pagination = PaginationMeta.for_cursor(
+                page_size=params.page_size,
+                cursor=params.cursor,
+                next_cursor=next_cursor,
+            )
+        else:
+            tenants, total = await self.tenant_repo.list_paginated(
+                offset=params.offset,
+                limit=params.limit,
+                status=params.status,
+                sort_by=params.sort_by,
+                sort_order=params.sort_order,
+            )
+            pagination = PaginationMeta.create(
+                page=params.page,
+                page_size=params.page_size,
+                total_items=total.total,
+                total_estimated=total.estimated,
+            )
 
         items = [
             TenantResponseSchema.model_validate(t)
             for t in tenants
         ]
 
-        pagination = PaginationMeta.create(
-            page=params.page,
-            page_size=params.page_size,
-            total_items=total,
-        )
-
         return PaginatedData(items=items, pagination=pagination)
     
     async def update_tenant(
@@ -53,7 +76,9 @@ class TenantService:
         
         tenant.name = data.name
 
-        return await self.tenant_repo.update(tenant)
+        tenant = await self.tenant_repo.update(tenant)
+        self._invalidate(tenant.id)
+        return tenant
     
     async def deactivate_tenant(
         self,
@@ -65,7 +90,9 @@ class TenantService:
         
         tenant.tenant_status = "inactive"
 
-        return await self.tenant_repo.update(tenant)
+        tenant = await self.tenant_repo.update(tenant)
+        self._invalidate(tenant.id)
+        return tenant
     
     async def reactivate_tenant(self, tenant_id):
         tenant = await self.tenant_repo.get_by_id(tenant_id)
@@ -76,4 +103,6 @@ class TenantService:
             return tenant  # idempotent
 
         tenant.tenant_status = "active"
-        return await self.tenant_repo.update(tenant)
\ No newline at end of file
+        tenant = await self.tenant_repo.update(tenant)
+        self._invalidate(tenant.id)
+        return tenant
\ No newline at end of file
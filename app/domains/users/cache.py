@@ -0,0 +1,70 @@
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.infrastructure.clients.redis_client import redis_client
+
+
+class UserSecurityVersions:
+    """
+    Per-user security version counters kept in Redis.
+
+    Access tokens embed the version current at issuance. Any change
+    that affects a user's access (status, role) bumps the counter,
+    which makes every previously issued token fall off the stateless
+    fast path. Versions are read from Redis on every request (no local
+    copy), so a bump takes effect on all workers immediately.
+
+    A missing counter is never read as a version: tokens are treated
+    as stale until it is seeded again. Seeds are the current time in
+    milliseconds, so a counter lost with Redis (flush, eviction) does
+    not restart at a value that tokens revoked before the loss carry.
+    """
+
+    def __init__(self, client: Redis):
+        self.client = client
+        self.prefix = "auth:user_version:"
+
+        self.lookups = 0
+        self.missing = 0
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.prefix}{user_id}"
+
+    @staticmethod
+    def _seed() -> int:
+        return time.time_ns() // 1_000_000
+
+    async def current(self, user_id: UUID) -> Optional[int]:
+        """The user's version, or None if the counter is missing."""
+        self.lookups += 1
+        raw = await self.client.get(self._key(user_id))
+        if raw is None:
+            self.missing += 1
+            return None
+        return int(raw)
+
+    async def issue(self, user_id: UUID) -> int:
+        """The version to embed in a new token, seeding the counter if missing."""
+        key = self._key(user_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, self._seed(), nx=True)
+            pipe.get(key)
+            _, raw = await pipe.execute()
+        return int(raw)
+
+    async def bump(self, user_id: UUID) -> None:
+        """Must run after the change is committed (see on_commit)."""
+        key = self._key(user_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, self._seed(), nx=True)
+            pipe.incr(key)
+            await pipe.execute()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"lookups": self.lookups, "missing": self.missing}
+
+
+user_security_versions = UserSecurityVersions(client=redis_client)
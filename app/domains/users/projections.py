@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.domains.rbac.roles.cache import CachedRole
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """
+    Compact view of the current user, loaded once per request.
+
+    Holds only what authentication and authorization need; credentials
+    and relationships are never loaded. Routes that need the full
+    profile (e.g. /users/me) fetch it explicitly.
+    """
+    id: UUID
+    user_status: str
+    tenant_id: Optional[UUID]
+    role_id: Optional[UUID]
+    # Compiled permissions handle from the RBAC cache (None if role is gone)
+    role: Optional[CachedRole]
@@ -1,15 +1,19 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domains.shared.repository import BaseRepository
+from app.domains.shared.keyset import Keyset
+from app.domains.shared.counting import Count, count_strategy
 from app.infrastructure.db.models.user import User
-from app.infrastructure.db.enums import UserStatus
+from app.infrastructure.db.enums import UserStatus, AuthMethodType
 from app.infrastructure.db.models.auth_rbac import Role
 from app.infrastructure.db.models.user_auth_method import UserAuthMethod
 
+USER_LIST_ORDER = Keyset(User.created_at, User.id, descending=True)
+
 
 class UserRepository(BaseRepository[User]):
     def __init__(self, session: AsyncSession):
@@ -23,8 +27,7 @@ class UserRepository(BaseRepository[User]):
         query = (
             select(self.model)
             .options(
-                selectinload(self.model.role)
-                .selectinload(Role.permissions),
+                # Role permissions are served by the RBAC cache
                 selectinload(self.model.auth_methods),
                 selectinload(self.model.tenant)
             )
@@ -37,6 +40,28 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(query)
         return result.unique().scalar_one_or_none()
     
+    async def get_auth_projection(
+        self,
+        *,
+        user_id: UUID,
+        tenant_id: Optional[UUID] = None,
+    ):
+        """
+        Single query for the columns request authentication needs.
+        No relationships (notably no auth_methods / password hashes).
+        """
+        query = select(
+            self.model.id,
+            self.model.user_status,
+            self.model.tenant_id,
+            self.model.role_id,
+        ).where(self.model.id == user_id)
+
+        if tenant_id is not None:
+            query = query.where(self.model.tenant_id == tenant_id)
+
+        return (await self.session.execute(query)).one_or_none()
+
     async def get_by_id_scoped(
         self,
         *,
@@ -92,20 +117,28 @@ class UserRepository(BaseRepository[User]):
         self.session.add(new_user)
         await self.session.flush()
         return new_user
+
+    async def add_password_auth_method(self, *, user_id: UUID, password_hash: str) -> UserAuthMethod:
+        auth_method = UserAuthMethod(
+            user_id=user_id,
+            auth_type=AuthMethodType.PASSWORD,
+            password_hash=password_hash,
+        )
+
+        self.session.add(auth_method)
+        await self.session.flush()
+        return auth_method
     
     
-    async def list_paginated(
+    def _filtered(
         self,
+        query,
         *,
         tenant_id,
-        offset: int,
-        limit: int,
         email: str | None = None,
         user_status: str | None = None,
         role_id=None,
     ):
-        query = select(self.model)
-
         # 🔒 Tenant isolation
         if tenant_id is not None:
             query = query.where(self.model.tenant_id == tenant_id)
@@ -120,26 +153,54 @@ class UserRepository(BaseRepository[User]):
         if role_id:
             query = query.where(self.model.role_id == role_id)
 
-        # Pagination
-        query = query.offset(offset).limit(limit)
-
-        users = (await self.session.execute(query)).scalars().all()
-
-        # Count query
-        count_query = select(func.count()).select_from(self.model)
-
-        if tenant_id is not None:
-            count_query = count_query.where(self.model.tenant_id == tenant_id)
-
-        if email:
-            count_query = count_query.where(self.model.email.ilike(f"%{email}%"))
-
-        if user_status:
-            count_query = count_query.where(self.model.user_status == user_status)
+        return query
 
-        if role_id:
-            count_query = count_query.where(self.model.role_id == role_id)
+    async def list_paginated(
+        self,
+        *,
+        tenant_id,
+        offset: int,
+        limit: int,
+        email: str | None = None,
+        user_status: str | None = None,
+        role_id=None,
+    ) -> tuple[list[User], Count]:
+        filters = dict(email=email, user_status=user_status, role_id=role_id)
+        query = self._filtered(select(self.model), tenant_id=tenant_id, **filters)
+
+        # Pagination: one extra row tells whether a next page exists
+        users = (await self.session.execute(query.offset(offset).limit(limit + 1))).scalars().all()
+
+        # Total: exact for small results, estimated (and cached) for large ones
+        total = await count_strategy.total(
+            self.session,
+            query,
+            table=self.model.__tablename__,
+            tenant_id=tenant_id,
+            filters=filters,
+            offset=offset,
+            limit=limit,
+            fetched=len(users),
+        )
 
-        total = (await self.session.execute(count_query)).scalar_one()
+        return users[:limit], total
 
-        return users, total
\ No newline at end of file
+    async def list_keyset(
+        self,
+        *,
+        tenant_id,
+        limit: int,
+        cursor: str | None = None,
+        email: str | None = None,
+        user_status: str | None = None,
+        role_id=None,
+    ) -> tuple[list[User], str | None]:
+        """Newest first; served by ix_users_tenant_created_at / ix_users_created_at."""
+        query = self._filtered(
+            select(self.model),
+            tenant_id=tenant_id,
+            email=email,
+            user_status=user_status,
+            role_id=role_id,
+        )
+        return await self.paginate_keyset(query, keyset=USER_LIST_ORDER, limit=limit, cursor=cursor)
@@ -1,5 +1,5 @@
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from typing import Optional, List
 from app.infrastructure.db.enums import UserStatus
 
@@ -20,6 +20,7 @@ class UserCreateSchema(BaseModel):
     last_name: str
     role_id: UUID
     tenant_id: Optional[UUID] = None
+    password: Optional[str] = Field(default=None, min_length=8)
 
 class UserUpdateSchema(BaseModel):
     first_name: Optional[str] = None
@@ -2,9 +2,13 @@ from uuid import UUID
 from app.domains.users.repository import UserRepository
 from app.domains.tenants.repository import TenantRepository
 from app.domains.rbac.roles.repository import RoleRepository
-from app.domains.users.schemas import UserCreateSchema, UserUpdateSchema, UserFilterParams, UserRoleAssignSchema
-from app.domains.shared.schemas.pagination import PaginationParams
+from app.domains.users.schemas import UserCreateSchema, UserSchema, UserUpdateSchema, UserFilterParams, UserRoleAssignSchema
+from app.domains.shared.schemas.pagination import PaginatedData, PaginationMeta, PaginationParams
 from app.core.exceptions import ResourceConflict, AuthorizationError, ResourceNotFound
+from app.security.hashing import hash_password_async
+from app.infrastructure.db.session import on_commit
+from app.domains.users.cache import user_security_versions
+from app.domains.auth.session_store import session_store
 
 
 class UserService:
@@ -18,6 +22,14 @@ class UserService:
         self.tenant_repo = tenant_repo
         self.role_repo = role_repo
 
+    def _invalidate(self, user_id) -> None:
+        """
+        After commit, bumps the user's security version, so access tokens
+        issued before the change lose the stateless fast path.
+        """
+        session = self.user_repo.session
+        on_commit(session, lambda: user_security_versions.bump(user_id))
+
     async def create_user(
         self,
         *,
@@ -62,6 +74,13 @@ class UserService:
             tenant_id=tenant_id,
         )
 
+        # 5️⃣ Optional password credential (hashed off the event loop)
+        if data.password:
+            await self.user_repo.add_password_auth_method(
+                user_id=user.id,
+                password_hash=await hash_password_async(data.password),
+            )
+
         return user
     
     async def list_users(
@@ -70,18 +89,46 @@ class UserService:
         actor,
         pagination: PaginationParams,
         filters: UserFilterParams,
-    ):
+    ) -> PaginatedData[UserSchema]:
         # 🔐 Resolve scope
         tenant_id = None if actor.tenant_id is None else actor.tenant_id
 
-        return await self.user_repo.list_paginated(
-            tenant_id=tenant_id,
-            offset=pagination.offset,
-            limit=pagination.limit,
+        filter_values = dict(
             email=filters.email,
             user_status=filters.user_status,
             role_id=filters.role_id,
         )
+
+        if pagination.use_cursor:
+            users, next_cursor = await self.user_repo.list_keyset(
+                tenant_id=tenant_id,
+                limit=pagination.limit,
+                cursor=pagination.cursor,
+                **filter_values,
+            )
+            meta = PaginationMeta.for_cursor(
+                page_size=pagination.page_size,
+                cursor=pagination.cursor,
+                next_cursor=next_cursor,
+            )
+        else:
+            users, total = await self.user_repo.list_paginated(
+                tenant_id=tenant_id,
+                offset=pagination.offset,
+                limit=pagination.limit,
+                **filter_values,
+            )
+            meta = PaginationMeta.create(
+                page=pagination.page,
+                page_size=pagination.page_size,
+                total_items=total.total,
+                total_estimated=total.estimated,
+            )
+
+        return PaginatedData(
+            items=[UserSchema.model_validate(u) for u in users],
+            pagination=meta,
+        )
     
     async def update_user(
         self,
@@ -122,6 +169,14 @@ class UserService:
         if data.user_status is not None:
             user.user_status = data.user_status
 
+            # Redis sessions do not see user status; end them explicitly
+            if user.user_status != "active" and session_store is not None:
+                on_commit(
+                    self.user_repo.session,
+                    lambda: session_store.revoke_all(user.id),
+                )
+
+        self._invalidate(user.id)
         return user
 
     async def assign_role(
@@ -169,5 +224,6 @@ class UserService:
 
         user.role_id = role.id
         await self.user_repo.session.flush()
+        self._invalidate(user.id)
 
         return user, role
\ No newline at end of file
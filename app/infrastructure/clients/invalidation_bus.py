@@ -0,0 +1,203 @@
+import asyncio
+import json
+import uuid
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.clients.redis_client import redis_client
+
+logger = get_logger(__name__)
+
+InvalidateHandler = Callable[[List[str]], None]
+FlushHandler = Callable[[], None]
+
+
+class InvalidationBus:
+    """
+    Cross-worker cache coherence over Redis pub/sub.
+
+    Services publish `(topic, key)` pairs after commit (e.g. ("tenant", id)).
+    Publishes are applied to local subscribers immediately, then batched
+    and broadcast so every other worker drops the same keys.
+
+    Pub/sub is fire-and-forget: anything sent while a worker is
+    disconnected is lost. So whenever the listener (re)subscribes after
+    a failure, every subscriber is told to flush its cache completely.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        channel: str,
+        batch_interval_seconds: float,
+        max_batch_size: int,
+    ):
+        self.client = client
+        self.channel = channel
+        self.batch_interval_seconds = batch_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.origin = uuid.uuid4().hex
+
+        self._invalidate_handlers: Dict[str, List[InvalidateHandler]] = {}
+        self._flush_handlers: List[FlushHandler] = []
+
+        self._pending: Set[Tuple[str, str]] = set()
+        self._pending_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self.published_messages = 0
+        self.received_messages = 0
+        self.full_flushes = 0
+
+    # ---- Subscribers ----
+
+    def subscribe(
+        self,
+        topic: str,
+        on_invalidate: InvalidateHandler,
+        on_flush: FlushHandler,
+    ) -> None:
+        self._invalidate_handlers.setdefault(topic, []).append(on_invalidate)
+        self._flush_handlers.append(on_flush)
+
+    def _dispatch(self, topic: str, keys: List[str]) -> None:
+        for handler in self._invalidate_handlers.get(topic, []):
+            try:
+                handler(keys)
+            except Exception:
+                logger.exception(f"Invalidation handler for '{topic}' failed")
+
+    def _flush_all(self) -> None:
+        self.full_flushes += 1
+        for handler in self._flush_handlers:
+            try:
+                handler()
+            except Exception:
+                logger.exception("Cache flush handler failed")
+
+    # ---- Publishing ----
+
+    async def publish(self, topic: str, key: str) -> None:
+        """
+        Invalidates `key` locally right away and queues it for broadcast.
+        Meant to be registered with on_commit().
+        """
+        self._dispatch(topic, [key])
+        self._pending.add((topic, key))
+        if self._pending_event is not None:
+            self._pending_event.set()
+
+    async def _send(self, items: List[Tuple[str, str]]) -> None:
+        for start in range(0, len(items), self.max_batch_size):
+            message = json.dumps({
+                "origin": self.origin,
+                "items": items[start:start + self.max_batch_size],
+            })
+            await self.client.publish(self.channel, message)
+            self.published_messages += 1
+
+    async def _publisher(self) -> None:
+        while True:
+            await self._pending_event.wait()
+            # Let writes from concurrent requests accumulate into one message
+            await asyncio.sleep(self.batch_interval_seconds)
+            self._pending_event.clear()
+
+            items, self._pending = sorted(self._pending), set()
+            try:
+                await self._send(items)
+            except Exception:
+                # Peers keep these entries until their own TTL or
+                # staleness window runs out
+                logger.exception(f"Failed to publish {len(items)} cache invalidations")
+
+    # ---- Listening ----
+
+    def _handle_message(self, data: str) -> None:
+        message = json.loads(data)
+        if message.get("origin") == self.origin:
+            return  # already applied locally
+
+        self.received_messages += 1
+        grouped: Dict[str, List[str]] = {}
+        for topic, key in message.get("items", []):
+            grouped.setdefault(topic, []).append(key)
+
+        for topic, keys in grouped.items():
+            self._dispatch(topic, keys)
+
+    async def _listener(self) -> None:
+        backoff = 0.5
+        recovering = False
+
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if recovering:
+                    logger.warning("Invalidation bus reconnected, flushing caches")
+                    self._flush_all()
+                    recovering = False
+                backoff = 0.5
+
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation bus connection lost")
+                recovering = True
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    # ---- Lifecycle ----
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._pending_event = asyncio.Event()
+        if self._pending:
+            self._pending_event.set()
+        self._tasks = [
+            asyncio.create_task(self._listener()),
+            asyncio.create_task(self._publisher()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._pending:
+            items, self._pending = sorted(self._pending), set()
+            try:
+                await self._send(items)
+            except Exception:
+                logger.exception("Failed to publish pending cache invalidations on shutdown")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "published_messages": self.published_messages,
+            "received_messages": self.received_messages,
+            "full_flushes": self.full_flushes,
+        }
+
+
+invalidation_bus = InvalidationBus(
+    redis_client,
+    channel=settings.CACHE_INVALIDATION_CHANNEL,
+    batch_interval_seconds=settings.CACHE_INVALIDATION_BATCH_MS / 1000,
+    max_batch_size=settings.CACHE_INVALIDATION_MAX_BATCH,
+)
@@ -0,0 +1,31 @@
+import json
+from typing import Any, Dict, List
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, with its bound parameters."""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def explain(session: AsyncSession, statement: Select) -> List[Dict[str, Any]]:
+    """Returns the planner's JSON plan for `statement` (it is not executed)."""
+    plan = (await session.execute(Explain(statement))).scalar_one()
+    return plan if isinstance(plan, list) else json.loads(plan)
+
+
+async def estimate_rows(session: AsyncSession, statement: Select) -> int:
+    """The planner's row estimate for `statement`."""
+    return int((await explain(session, statement))[0]["Plan"]["Plan Rows"])
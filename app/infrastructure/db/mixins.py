@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid_utils
 from sqlalchemy import DateTime, ForeignKey, func, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, declared_attr
@@ -21,6 +21,26 @@ class IDMixin:
         nullable=False,
     )
 
+class TimePartitionedMixin:
+    """
+    Primary key (id, created_at) for tables range-partitioned by month
+    on created_at; Postgres requires the partition key in every unique
+    constraint. Use instead of IDMixin, together with TimestampMixin.
+    """
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7_uuid,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
+    )
+
 class TimestampMixin:
     """Mixin for record lifecycle tracking using UTC."""
     created_at: Mapped[datetime] = mapped_column(
@@ -5,7 +5,7 @@ from .user_auth_method import UserAuthMethod
 from .refresh_token import RefreshToken  # Ensure this is here
 from .login_attempt import LoginAttempt   # Ensure this is here
 from .auth_rbac import Role, Permission, RolePermission
-from .audit import AuditLog
+from .audit import AuditLog, AuditOutbox
 
 __all__ = [
     "Tenant",
@@ -17,4 +17,5 @@ __all__ = [
     "Permission",
     "RolePermission",
     "AuditLog",
+    "AuditOutbox",
 ]
\ No newline at end of file
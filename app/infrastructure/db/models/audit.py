@@ -1,14 +1,16 @@
+from datetime import datetime
 from uuid import UUID
 from sqlalchemy.dialects import postgresql
-from sqlalchemy import String, ForeignKey, Text, JSON, Index
-from sqlalchemy.dialects.postgresql import INET
+from sqlalchemy import String, ForeignKey, Text, Index, DateTime, func
+from sqlalchemy.dialects.postgresql import INET, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from app.infrastructure.db.base import Base
-from app.infrastructure.db.mixins import IDMixin, TimestampMixin, TenantMixin
+from app.infrastructure.db.mixins import IDMixin, TimePartitionedMixin, TimestampMixin, TenantMixin
 
-class AuditLog(Base, IDMixin, TimestampMixin, TenantMixin):
+class AuditLog(Base, TimePartitionedMixin, TimestampMixin, TenantMixin):
     """
     Centralized audit trail for all significant system changes.
+    Range-partitioned by month on created_at (see db/partitions.py).
     """
     __tablename__ = "audit_logs"
 
@@ -27,11 +29,48 @@ class AuditLog(Base, IDMixin, TimestampMixin, TenantMixin):
     user_agent: Mapped[str] = mapped_column(Text, nullable=True)
     
     # The 'Before' and 'After' states or general metadata
-    # Use JSONB for fast searching in PostgreSQL
-    payload: Mapped[dict] = mapped_column(JSON, nullable=True)
+    # JSONB + GIN (jsonb_path_ops) index for containment (@>) searches
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=True)
 
+    # Each filter of GET /audit-logs has an index ending in (created_at, id),
+    # so a page is one ordered range scan (keyset pagination, newest first)
     __table_args__ = (
-        Index("ix_audit_logs_actor_id", "actor_id"),
-        Index("ix_audit_logs_resource", "resource_type", "resource_id"),
-        Index("ix_audit_logs_action", "action"),
-    )
\ No newline at end of file
+        Index("ix_audit_logs_created_at", "created_at", "id"),
+        Index("ix_audit_logs_tenant_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_audit_logs_actor_created_at", "actor_id", "created_at", "id"),
+        Index("ix_audit_logs_action_created_at", "tenant_id", "action", "created_at", "id"),
+        Index("ix_audit_logs_resource_created_at", "resource_type", "resource_id", "created_at", "id"),
+        Index(
+            "ix_audit_logs_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class AuditOutbox(Base, IDMixin):
+    """
+    Transactional outbox for audit entries.
+
+    Written in the same transaction as the business change and moved
+    into audit_logs by AuditOutboxRelay. Ids are UUIDv7, so ordering by
+    id is roughly insertion order. No foreign keys or secondary indexes:
+    inserts stay cheap and never lock referenced rows.
+    """
+    __tablename__ = "audit_outbox"
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    tenant_id: Mapped[UUID] = mapped_column(postgresql.UUID(as_uuid=True), nullable=True)
+    actor_id: Mapped[UUID] = mapped_column(postgresql.UUID(as_uuid=True), nullable=True)
+    action: Mapped[str] = mapped_column(String(100), nullable=False)
+    resource_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    resource_id: Mapped[str] = mapped_column(String(100), nullable=True)
+    ip_address: Mapped[str] = mapped_column(postgresql.INET, nullable=True)
+    user_agent: Mapped[str] = mapped_column(Text, nullable=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=True)
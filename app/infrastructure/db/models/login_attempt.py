@@ -1,19 +1,26 @@
 import uuid
 from typing import Optional
-from sqlalchemy import String, ForeignKey, Boolean, Text
+from sqlalchemy import String, ForeignKey, Boolean, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import INET
 
 from app.infrastructure.db.base import Base
-from app.infrastructure.db.mixins import IDMixin, TimestampMixin, TenantMixin
+from app.infrastructure.db.mixins import TimePartitionedMixin, TimestampMixin, TenantMixin
 
-class LoginAttempt(Base, IDMixin, TimestampMixin, TenantMixin):
+class LoginAttempt(Base, TimePartitionedMixin, TimestampMixin, TenantMixin):
     """
     Audit log for tracking authentication attempts.
     Used for security monitoring and rate limiting.
+    Range-partitioned by month on created_at (see db/partitions.py).
     """
     __tablename__ = "login_attempts"
 
+    # Retention drops whole monthly partitions
+    __table_args__ = (
+        Index("ix_login_attempts_created_at", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     # We use the raw email because the attempt might be for a user that doesn't exist
     email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, DateTime, Index
+from sqlalchemy import LargeBinary, ForeignKey, DateTime, Index, CheckConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.base import Base
@@ -19,9 +19,18 @@ class RefreshToken(Base, IDMixin, TimestampMixin, TenantMixin):
 
     # Table arguments for performance and lookup
     __table_args__ = (
-        Index("ix_refresh_tokens_token_hash", "token_hash"),
+        Index("ux_refresh_tokens_token_hash", "token_hash", unique=True),
         Index("ix_refresh_tokens_user_id", "user_id"),
         Index("ix_refresh_tokens_tenant_id", "tenant_id"),
+        # Retention reaper predicates and the replaced_by FK (ON DELETE SET NULL)
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+        ),
+        Index("ix_refresh_tokens_replaced_by", "replaced_by"),
+        CheckConstraint("octet_length(token_hash) = 32", name="ck_refresh_tokens_token_hash_length"),
     )
 
     # --- Identity & Ownership ---
@@ -32,8 +41,10 @@ class RefreshToken(Base, IDMixin, TimestampMixin, TenantMixin):
     )
     
     # --- Token Data ---
-    # Store a SHA-256 hash of the refresh token. Never store raw tokens in the DB.
-    token_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Raw SHA-256 digest (32 bytes) of the token secret. Never store raw tokens in the DB.
+    # Tokens are `<id>.<secret>` and fetched by primary key; the unique
+    # index serves legacy tokens that predate that format.
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     
     # --- Lifecycle & Security ---
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
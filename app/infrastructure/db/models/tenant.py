@@ -22,6 +22,8 @@ class Tenant(Base, IDMixin, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("name", name="uq_tenant_name"),
         Index("ix_tenants_is_active", "tenant_status"),
+        # Keyset pagination of GET /tenants by created_at (name is unique already)
+        Index("ix_tenants_created_at", "created_at", "id"),
     )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
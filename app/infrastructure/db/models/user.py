@@ -24,6 +24,9 @@ class User(Base, IDMixin, TimestampMixin, TenantMixin):
     __table_args__ = (
         Index("ix_users_email", "email"),
         Index("ix_users_is_active", "user_status"),
+        # Keyset pagination of GET /users (newest first, per tenant or global)
+        Index("ix_users_tenant_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_users_created_at", "created_at", "id"),
     )
 
     # Global Email Uniqueness: No two users in the entire system can have the same email.
@@ -0,0 +1,174 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class MonthlyPartitioning:
+    """
+    A table range-partitioned by month on created_at.
+    Partitions are named `<table>_pYYYYMM`; with a `retention`, whole
+    partitions are dropped once all their rows are older than it.
+    """
+    table: str
+    retention: Optional[timedelta] = None
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+class PartitionManager:
+    """
+    Keeps monthly partitions ahead of time and drops expired ones.
+
+    Inserts fail if no partition covers their created_at, so partitions
+    are created `premake_months` ahead, on startup and then periodically.
+    Every table is handled in its own short transaction, guarded by an
+    advisory lock so only one worker does it at a time, and with a low
+    lock_timeout so DDL never queues behind request traffic.
+    """
+
+    def __init__(
+        self,
+        tables: List[MonthlyPartitioning],
+        *,
+        premake_months: int,
+        interval_seconds: float,
+        lock_timeout_ms: int,
+    ):
+        self.tables = tables
+        self.premake_months = premake_months
+        self.interval_seconds = interval_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.failures = 0
+        self.partitions_created = 0
+        self.partitions_dropped = 0
+
+    async def _maintain(self, spec: MonthlyPartitioning) -> None:
+        today = datetime.now(timezone.utc).date()
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                locked = (await session.execute(
+                    text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                    {"key": f"partitions:{spec.table}"},
+                )).scalar_one()
+                if not locked:
+                    return  # another worker is on it
+                await session.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+
+                existing = set((await session.execute(
+                    text(
+                        "SELECT child.relname FROM pg_inherits "
+                        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                        "WHERE parent.relname = :table"
+                    ),
+                    {"table": spec.table},
+                )).scalars())
+
+                # 1. Future partitions
+                for offset in range(self.premake_months + 1):
+                    month = add_months(month_start(today), offset)
+                    name = partition_name(spec.table, month)
+                    if name in existing:
+                        continue
+                    await session.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {spec.table} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{add_months(month, 1).isoformat()}')"
+                    ))
+                    self.partitions_created += 1
+                    logger.info(f"Created partition {name}")
+
+                # 2. Expired partitions
+                if spec.retention is None:
+                    return
+
+                cutoff = today - spec.retention
+                pattern = re.compile(rf"^{re.escape(spec.table)}_p(\d{{4}})(\d{{2}})$")
+                for name in sorted(existing):
+                    match = pattern.match(name)
+                    if not match:
+                        continue
+                    month = date(int(match.group(1)), int(match.group(2)), 1)
+                    if add_months(month, 1) <= cutoff:
+                        await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                        self.partitions_dropped += 1
+                        logger.info(f"Dropped expired partition {name}")
+
+    async def run_once(self) -> None:
+        self.runs += 1
+        for spec in self.tables:
+            try:
+                await self._maintain(spec)
+            except Exception:
+                self.failures += 1
+                logger.exception(f"Partition maintenance for {spec.table} failed")
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "partitions_created": self.partitions_created,
+            "partitions_dropped": self.partitions_dropped,
+        }
+
+
+partition_manager = PartitionManager(
+    [
+        MonthlyPartitioning(
+            table="audit_logs",
+            retention=(
+                timedelta(days=settings.AUDIT_LOG_RETENTION_DAYS)
+                if settings.AUDIT_LOG_RETENTION_DAYS > 0 else None
+            ),
+        ),
+        MonthlyPartitioning(
+            table="login_attempts",
+            retention=timedelta(days=settings.LOGIN_ATTEMPT_RETENTION_DAYS),
+        ),
+    ],
+    premake_months=settings.PARTITION_PREMAKE_MONTHS,
+    interval_seconds=settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+    lock_timeout_ms=settings.REAPER_LOCK_TIMEOUT_MS,
+)
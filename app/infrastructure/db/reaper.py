@@ -0,0 +1,146 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionRule:
+    """Rows of `table` matching `condition` (bound to :cutoff) are reclaimed."""
+    table: str
+    condition: str
+    retention: timedelta
+
+
+class RetentionReaper:
+    """
+    Background worker that deletes aged rows in small batches.
+    (Partitioned tables are not reaped row by row; see partitions.py.)
+
+    Every batch is its own short transaction:
+
+        DELETE FROM t WHERE ctid IN (
+            SELECT ctid FROM t WHERE <condition> LIMIT n FOR UPDATE SKIP LOCKED
+        )
+
+    SKIP LOCKED plus a low lock_timeout mean the reaper never waits on
+    request traffic (or on the reaper of another worker), and the pause
+    between batches keeps it from saturating the database.
+    """
+
+    def __init__(
+        self,
+        rules: List[RetentionRule],
+        *,
+        interval_seconds: float,
+        batch_size: int,
+        batch_pause_seconds: float,
+        max_batches_per_run: int,
+        lock_timeout_ms: int,
+    ):
+        self.rules = rules
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.max_batches_per_run = max_batches_per_run
+        self.lock_timeout_ms = lock_timeout_ms
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.failed_batches = 0
+        self.last_run_seconds = 0.0
+        self.rows_reclaimed: Dict[str, int] = {rule.table: 0 for rule in rules}
+
+    async def _delete_batch(self, rule: RetentionRule, cutoff: datetime) -> int:
+        statement = text(
+            f"DELETE FROM {rule.table} WHERE ctid IN ("
+            f"SELECT ctid FROM {rule.table} WHERE {rule.condition} "
+            f"LIMIT :limit FOR UPDATE SKIP LOCKED)"
+        )
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+                result = await session.execute(statement, {"cutoff": cutoff, "limit": self.batch_size})
+                return result.rowcount
+
+    async def reap(self, rule: RetentionRule) -> int:
+        """Deletes up to `max_batches_per_run` batches for one rule."""
+        cutoff = datetime.now(timezone.utc) - rule.retention
+        total = 0
+
+        for _ in range(self.max_batches_per_run):
+            try:
+                deleted = await self._delete_batch(rule, cutoff)
+            except Exception:
+                self.failed_batches += 1
+                logger.exception(f"Reaper batch on {rule.table} failed")
+                break
+
+            total += deleted
+            self.rows_reclaimed[rule.table] += deleted
+            if deleted < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause_seconds)
+
+        return total
+
+    async def run_once(self) -> Dict[str, int]:
+        start = time.perf_counter()
+        reclaimed = {rule.table: await self.reap(rule) for rule in self.rules}
+        self.last_run_seconds = time.perf_counter() - start
+        self.runs += 1
+
+        if any(reclaimed.values()):
+            logger.info(f"Reaper reclaimed {reclaimed} in {self.last_run_seconds:.2f}s")
+        return reclaimed
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "rows_reclaimed": dict(self.rows_reclaimed),
+            "failed_batches": self.failed_batches,
+            "last_run_seconds": round(self.last_run_seconds, 3),
+        }
+
+
+reaper = RetentionReaper(
+    [
+        # Only past expiry: a revoked (rotated) token that is still within
+        # its lifetime must stay, so replaying it trips reuse detection
+        RetentionRule(
+            table="refresh_tokens",
+            condition="expires_at < :cutoff",
+            retention=timedelta(days=settings.REFRESH_TOKEN_RETENTION_DAYS),
+        ),
+    ],
+    interval_seconds=settings.REAPER_INTERVAL_SECONDS,
+    batch_size=settings.REAPER_BATCH_SIZE,
+    batch_pause_seconds=settings.REAPER_BATCH_PAUSE_MS / 1000,
+    max_batches_per_run=settings.REAPER_MAX_BATCHES_PER_RUN,
+    lock_timeout_ms=settings.REAPER_LOCK_TIMEOUT_MS,
+)
@@ -1,3 +1,5 @@
+from typing import Awaitable, Callable
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -5,6 +7,9 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 # Async engine (connection pool managed here)
 engine = create_async_engine(
@@ -21,3 +26,32 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
     class_=AsyncSession,
 )
+
+
+# ---- After-commit hooks ----
+# Side effects that must only be visible once the transaction is durable
+# (cache invalidation, event publishing) are queued on the session and
+# run by get_db right after a successful commit.
+
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Queues an async callback to run after `session` commits."""
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+def discard_commit_hooks(session: AsyncSession) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+async def run_commit_hooks(session: AsyncSession) -> None:
+    """
+    Runs queued callbacks. The data is already committed at this point,
+    so failures are logged rather than raised.
+    """
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("After-commit hook failed")
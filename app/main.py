@@ -3,10 +3,18 @@ from fastapi.responses import JSONResponse
 from app.middleware.cors import setup_cors
 from app.core.exceptions import AppException
 from app.api.v1.api import api_router
+from app.api.well_known.routes import router as well_known_router
 from app.core.config import settings
 from app.core.openapi import custom_openapi
 from app.infrastructure.db.session import engine
 from app.infrastructure.clients.redis_client import redis_client
+from app.security.hashing import shutdown_hashing_pool
+from app.infrastructure.clients.invalidation_bus import invalidation_bus
+from app.domains.auth.session_store import session_persister
+from app.infrastructure.db.reaper import reaper
+from app.infrastructure.db.partitions import partition_manager
+from app.domains.audit.writer import audit_writer
+from app.domains.audit.outbox import audit_outbox_relay
 from app.core.responses import ErrorResponse, ErrorDetail
 from app.middleware.request_context import RequestContextMiddleware
 from app.core.logging import setup_logging, get_logger
@@ -58,9 +66,31 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
     )
 
 
+@app.on_event("startup")
+async def startup_event():
+    await invalidation_bus.start()
+    await partition_manager.start()
+    if settings.AUDIT_WRITE_MODE == "buffered":
+        await audit_writer.start()
+    elif settings.AUDIT_WRITE_MODE == "outbox":
+        await audit_outbox_relay.start()
+    await session_persister.start()
+    if settings.REAPER_ENABLED:
+        await reaper.start()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
+    await invalidation_bus.stop()
+    await session_persister.stop()
+    await reaper.stop()
+    await partition_manager.stop()
+    # Drain buffered audit entries before the engine goes away
+    await audit_writer.stop()
+    await audit_outbox_relay.stop()
     await engine.dispose()
     await redis_client.close()
+    shutdown_hashing_pool()
 
 app.include_router(api_router, prefix="/api/v1")
+app.include_router(well_known_router)
@@ -1,12 +1,54 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
-ph = PasswordHasher(
-    time_cost=3,      # Number of iterations
-    memory_cost=65536, # 64MiB of RAM
-    parallelism=4,    # Number of parallel threads
-    hash_len=32,      # Length of the resulting hash
-    salt_len=16       # Length of the random salt
+from app.core.admission import AdmissionController
+from app.core.config import settings
+
+# Named Argon2id parameter sets: (time_cost, memory_cost KiB, parallelism)
+HASHING_PROFILES = {
+    "constrained": (2, 19456, 1),   # OWASP minimum, 19MiB
+    "standard": (3, 65536, 4),      # 64MiB
+    "hardened": (4, 131072, 4),     # 128MiB
+}
+
+
+def build_password_hasher(
+    profile: str,
+    *,
+    time_cost: Optional[int] = None,
+    memory_cost: Optional[int] = None,
+    parallelism: Optional[int] = None,
+) -> PasswordHasher:
+    """
+    Builds a PasswordHasher from a named profile.
+    Explicit values (e.g. from the calibration script) override the profile.
+    """
+    if profile not in HASHING_PROFILES:
+        raise ValueError(
+            f"Unknown password hashing profile '{profile}'. "
+            f"Expected one of: {', '.join(HASHING_PROFILES)}"
+        )
+
+    default_time, default_memory, default_parallelism = HASHING_PROFILES[profile]
+
+    return PasswordHasher(
+        time_cost=time_cost or default_time,              # Number of iterations
+        memory_cost=memory_cost or default_memory,        # KiB of RAM
+        parallelism=parallelism or default_parallelism,   # Number of parallel threads
+        hash_len=32,      # Length of the resulting hash
+        salt_len=16       # Length of the random salt
+    )
+
+
+ph = build_password_hasher(
+    settings.PASSWORD_HASH_PROFILE,
+    time_cost=settings.PASSWORD_HASH_TIME_COST,
+    memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+    parallelism=settings.PASSWORD_HASH_PARALLELISM,
 )
 
 def hash_password(password: str) -> str:
@@ -24,4 +66,67 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         return ph.verify(hashed_password, plain_password)
     except VerifyMismatchError:
-        return False
\ No newline at end of file
+        return False
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    True if the hash was produced with parameters other than the
+    currently configured ones. Cheap: only parses the hash header.
+    """
+    return ph.check_needs_rehash(hashed_password)
+
+
+# ---- Async API (off the event loop) ----
+
+_executor: Optional[Executor] = None
+
+# Bounds running + queued hash jobs. Callers beyond the queue, or waiting
+# longer than the timeout, are shed with a 503 instead of piling up.
+hashing_admission = AdmissionController(
+    "password_hashing",
+    max_concurrent=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    queue_timeout_seconds=settings.PASSWORD_HASH_QUEUE_TIMEOUT_MS / 1000,
+)
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="argon2",
+            )
+    return _executor
+
+
+async def _run(fn, *args):
+    async with hashing_admission.slot():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Same as hash_password, but runs on the hashing pool
+    so the event loop keeps serving other requests.
+    """
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Same as verify_password, but runs on the hashing pool
+    so the event loop keeps serving other requests.
+    """
+    return await _run(verify_password, plain_password, hashed_password)
+
+
+def shutdown_hashing_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,145 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+from app.core.config import settings
+
+# JWT algorithm -> accepted (private, public) key classes
+SUPPORTED_ALGORITHMS = {
+    "RS256": (rsa.RSAPrivateKey, rsa.RSAPublicKey),
+    "ES256": (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey),
+    "EdDSA": (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey),
+}
+
+_JWK_EXPORTERS = {
+    "RS256": RSAAlgorithm.to_jwk,
+    "ES256": ECAlgorithm.to_jwk,
+    "EdDSA": OKPAlgorithm.to_jwk,
+}
+
+# RFC 7638 required members per key type, used for kid thumbprints
+_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+def _infer_algorithm(public_key: Any) -> str:
+    """Maps a public key object to the JWT algorithm it is used with."""
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RS256"
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        if public_key.curve.name != "secp256r1":
+            raise ValueError("ES256 requires a P-256 (secp256r1) key")
+        return "ES256"
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+
+def _thumbprint(jwk: Dict[str, Any]) -> str:
+    """RFC 7638 JWK thumbprint (SHA-256, base64url without padding)."""
+    members = {k: jwk[k] for k in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationKey:
+    kid: str
+    algorithm: str
+    key: Any
+    jwk: Dict[str, Any]
+
+    @classmethod
+    def from_pem(cls, public_key_pem: str, kid: Optional[str] = None) -> "VerificationKey":
+        public_key = serialization.load_pem_public_key(public_key_pem.encode())
+        algorithm = _infer_algorithm(public_key)
+
+        jwk = _JWK_EXPORTERS[algorithm](public_key, as_dict=True)
+        kid = kid or _thumbprint(jwk)
+        jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+
+        return cls(kid=kid, algorithm=algorithm, key=public_key, jwk=jwk)
+
+
+class KeyRing:
+    """
+    Parsed JWT keys indexed by `kid`.
+
+    Exactly one key signs new tokens; any number of additional public
+    keys (upcoming or retired) stay valid for verification, which lets
+    keys rotate without invalidating sessions. PEM parsing and the JWKS
+    document are computed once here, never per request.
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: str,
+        private_key_pem: str,
+        public_key_pem: str,
+        active_kid: Optional[str] = None,
+        verification_keys: Iterable[Union[str, Mapping[str, str]]] = (),
+    ):
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported JWT algorithm '{algorithm}'. "
+                f"Expected one of: {', '.join(SUPPORTED_ALGORITHMS)}"
+            )
+
+        private_cls, _ = SUPPORTED_ALGORITHMS[algorithm]
+        signing_key = serialization.load_pem_private_key(private_key_pem.encode(), password=None)
+        active = VerificationKey.from_pem(public_key_pem, kid=active_kid)
+
+        if not isinstance(signing_key, private_cls) or active.algorithm != algorithm:
+            raise ValueError(f"Configured keys do not match JWT algorithm '{algorithm}'")
+
+        self.algorithm = algorithm
+        self.signing_key: Any = signing_key
+        self.active_kid = active.kid
+
+        self._keys: Dict[str, VerificationKey] = {active.kid: active}
+        # Entries are a bare PEM (kid = thumbprint) or {"kid": ..., "pem": ...};
+        # a retired key must keep the kid its tokens were signed with
+        for entry in verification_keys:
+            if isinstance(entry, str):
+                key = VerificationKey.from_pem(entry)
+            elif "pem" in entry:
+                key = VerificationKey.from_pem(entry["pem"], kid=entry.get("kid"))
+            else:
+                raise ValueError("JWT verification key entries need a 'pem'")
+            self._keys.setdefault(key.kid, key)
+
+        self.jwks: Dict[str, Any] = {"keys": [k.jwk for k in self._keys.values()]}
+        self.jwks_json: bytes = json.dumps(self.jwks, separators=(",", ":")).encode()
+
+    def get(self, kid: Optional[str]) -> Optional[VerificationKey]:
+        """
+        O(1) lookup of a verification key by `kid`.
+        Tokens issued before kid headers existed fall back to the active key.
+        """
+        if kid is None:
+            return self._keys[self.active_kid]
+        return self._keys.get(kid)
+
+    @classmethod
+    def from_settings(cls) -> "KeyRing":
+        return cls(
+            algorithm=settings.JWT_ALGORITHM,
+            private_key_pem=settings.PRIVATE_KEY,
+            public_key_pem=settings.PUBLIC_KEY,
+            active_kid=settings.JWT_KEY_ID,
+            verification_keys=settings.JWT_VERIFICATION_KEYS,
+        )
+
+
+key_ring = KeyRing.from_settings()
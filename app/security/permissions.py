@@ -1,17 +1,91 @@
-def has_permission(user_permissions: list[str], required_perm: str) -> bool:
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable
+
+WILDCARD = "*"
+SEPARATOR = ":"
+
+
+class _TrieNode:
+    __slots__ = ("children", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        # True if a '<path>:*' grant ends at this node
+        self.wildcard = False
+
+
+class CompiledPermissions:
     """
-    Checks if the required permission exists in the user's permission list.
-    Supports wildcards like 'users:*'.
+    Immutable, pre-built permission set for a role.
+
+    Exact slugs live in a frozenset; wildcard grants live in a trie keyed
+    by slug segments, so a check costs O(segments of the required slug)
+    no matter how many permissions the role has.
+
+    Supported grants:
+        'users:view'          exact match
+        'users:*'             anything under 'users:'
+        'billing:invoices:*'  anything under 'billing:invoices:'
+        '*'                   everything
     """
-    # 1. Direct match
-    if required_perm in user_permissions:
-        return True
-    
-    # 2. Wildcard match (e.g., 'users:*' matches 'users:create')
-    if ":" in required_perm:
-        resource = required_perm.split(":")[0]
-        wildcard_perm = f"{resource}:*"
-        if wildcard_perm in user_permissions:
+
+    __slots__ = ("slugs", "_root")
+
+    def __init__(self, slugs: Iterable[str]):
+        self.slugs: FrozenSet[str] = frozenset(slugs)
+        self._root = _TrieNode()
+
+        for slug in self.slugs:
+            segments = slug.split(SEPARATOR)
+            if segments[-1] != WILDCARD:
+                continue
+
+            node = self._root
+            for segment in segments[:-1]:
+                node = node.children.setdefault(segment, _TrieNode())
+            node.wildcard = True
+
+    def allows(self, required_perm: str) -> bool:
+        # 1. Direct match
+        if required_perm in self.slugs:
             return True
-            
-    return False
\ No newline at end of file
+
+        # 2. Wildcard match: walk the trie along the required slug's segments.
+        # A wildcard only covers segments *below* it, so the last segment
+        # of the required slug is never consumed.
+        node = self._root
+        segments = required_perm.split(SEPARATOR)
+        for segment in segments[:-1]:
+            if node.wildcard:
+                return True
+            node = node.children.get(segment)
+            if node is None:
+                return False
+
+        return node.wildcard
+
+    def __contains__(self, required_perm: str) -> bool:
+        return self.allows(required_perm)
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+
+@lru_cache(maxsize=1024)
+def compile_permissions(slugs: FrozenSet[str]) -> CompiledPermissions:
+    """
+    Returns the compiled matcher for a set of slugs.
+    Identical permission sets (i.e. the same role) share one instance.
+    """
+    return CompiledPermissions(slugs)
+
+
+def has_permission(user_permissions: Iterable[str], required_perm: str) -> bool:
+    """
+    Checks if the required permission is granted by the user's permissions.
+    Supports wildcards like 'users:*', 'billing:invoices:*' and '*'.
+    """
+    if isinstance(user_permissions, CompiledPermissions):
+        return user_permissions.allows(required_perm)
+
+    return compile_permissions(frozenset(user_permissions)).allows(required_perm)
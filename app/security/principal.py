@@ -0,0 +1,56 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Immutable identity resolved from a verified access token.
+    Built once per request and shared by every auth dependency.
+
+    Tokens issued with version claims also carry the user's role and
+    the role/user versions current at issuance. While both versions
+    still match Redis, the request is authorized without a DB query.
+    """
+
+    user_id: uuid.UUID
+    tenant_id: Optional[uuid.UUID]
+    jti: Optional[str]
+    expires_at: datetime
+    role_id: Optional[uuid.UUID] = None
+    role_version: Optional[int] = None
+    user_version: Optional[int] = None
+
+    @property
+    def has_version_claims(self) -> bool:
+        return self.user_version is not None
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "Principal":
+        """
+        Builds a principal from decoded JWT claims.
+        Raises ValueError if a required claim is missing or malformed.
+        """
+        sub = claims.get("sub")
+        if not sub:
+            raise ValueError("Missing sub in token")
+
+        if claims.get("type", "access") != "access":
+            raise ValueError("Not an access token")
+
+        tenant_id = claims.get("tenant_id")
+        role_id = claims.get("role_id")
+        role_version = claims.get("rv")
+        user_version = claims.get("uv")
+
+        return cls(
+            user_id=uuid.UUID(str(sub)),
+            tenant_id=uuid.UUID(str(tenant_id)) if tenant_id else None,
+            jti=claims.get("jti"),
+            expires_at=datetime.fromtimestamp(int(claims["exp"]), tz=timezone.utc),
+            role_id=uuid.UUID(str(role_id)) if role_id else None,
+            role_version=int(role_version) if role_version is not None else None,
+            user_version=int(user_version) if user_version is not None else None,
+        )
@@ -0,0 +1,46 @@
+import hashlib
+import hmac
+import secrets
+import uuid
+from typing import Optional, Tuple
+
+# 32 random bytes -> 43 url-safe characters
+SECRET_BYTES = 32
+
+
+def hash_refresh_secret(secret: str) -> bytes:
+    """Fixed-width SHA-256 digest stored in refresh_tokens.token_hash."""
+    return hashlib.sha256(secret.encode()).digest()
+
+
+def generate_refresh_token(token_id: uuid.UUID) -> Tuple[str, bytes]:
+    """
+    Returns `(token, digest)` for a new refresh token.
+
+    The token has the form `<id>.<secret>`: the id is the row's primary
+    key, so lookups are a PK fetch. Only the digest of the secret is
+    persisted.
+    """
+    secret = secrets.token_urlsafe(SECRET_BYTES)
+    return f"{token_id}.{secret}", hash_refresh_secret(secret)
+
+
+def parse_refresh_token(token: str) -> Optional[Tuple[uuid.UUID, str]]:
+    """
+    Splits a `<id>.<secret>` token.
+    Returns None for malformed tokens and for the legacy format
+    (a bare UUID), which is looked up by digest instead.
+    """
+    token_id, sep, secret = token.partition(".")
+    if not sep or not secret:
+        return None
+
+    try:
+        return uuid.UUID(token_id), secret
+    except ValueError:
+        return None
+
+
+def verify_refresh_secret(secret: str, token_hash: bytes) -> bool:
+    """Constant-time comparison against the stored digest."""
+    return hmac.compare_digest(hash_refresh_secret(secret), token_hash)
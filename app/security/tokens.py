@@ -4,6 +4,10 @@ from typing import Any, Dict, Optional
 import jwt
 
 from app.core.config import settings
+from app.security.keys import key_ring
+from app.security.token_cache import VerifiedTokenCache
+
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
 
 
 def create_jwt_token(
@@ -11,11 +15,13 @@ def create_jwt_token(
     tenant_id: Optional[uuid.UUID],
     expires_delta: timedelta,
     token_type: str = "access",
+    claims: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
-    Generates a signed RS256 JWT.
+    Generates a JWT signed with the configured algorithm.
     Encodes identity and tenant scope.
-    Authority is resolved dynamically via RBAC.
+    Authority is resolved dynamically via RBAC; `claims` may carry
+    version hints that let requests skip the database (see Principal).
     """
     now = datetime.now(timezone.utc)
     expire = now + expires_delta
@@ -28,21 +34,38 @@ def create_jwt_token(
         "exp": expire,
         "jti": str(uuid.uuid4()),
     }
+    if claims:
+        payload.update(claims)
 
     return jwt.encode(
         payload,
-        settings.PRIVATE_KEY,
-        algorithm="RS256",
+        key_ring.signing_key,
+        algorithm=key_ring.algorithm,
+        headers={"kid": key_ring.active_kid},
     )
 
 
 def decode_token(token: str) -> Dict[str, Any]:
     """
-    Decodes and validates a JWT using the public key.
+    Decodes and validates a JWT using the key named by its `kid` header.
     Raises jwt exceptions if invalid or expired.
+    Previously verified tokens are served from the in-process cache
+    until their `exp`.
     """
-    return jwt.decode(
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = key_ring.get(kid)
+    if key is None:
+        raise jwt.InvalidTokenError("Unknown signing key")
+
+    payload = jwt.decode(
         token,
-        settings.PUBLIC_KEY,
-        algorithms=["RS256"],
+        key.key,
+        algorithms=[key.algorithm],
     )
+
+    token_cache.put(token, payload)
+    return payload
@@ -0,0 +1,71 @@
+"""
+Compares JWT sign/verify throughput per algorithm, and pre-parsed key
+objects against passing PEM strings to PyJWT on every call.
+
+Run from the project root:
+    python -m scripts.benchmarks.bench_jwt_algorithms
+"""
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from scripts.benchmarks._env import bootstrap, report, timeit
+
+bootstrap()
+
+from app.security.keys import KeyRing  # noqa: E402
+
+ITERATIONS = 500
+
+GENERATORS = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": lambda: ed25519.Ed25519PrivateKey.generate(),
+}
+
+
+def _pems(private_key) -> tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return private_pem, public_pem
+
+
+def main() -> None:
+    payload = {"sub": "bench", "exp": int(time.time()) + 900}
+
+    for algorithm, generate in GENERATORS.items():
+        private_pem, public_pem = _pems(generate())
+        keys = KeyRing(algorithm=algorithm, private_key_pem=private_pem, public_key_pem=public_pem)
+        verification_key = keys.get(keys.active_kid).key
+        token = jwt.encode(payload, keys.signing_key, algorithm=algorithm)
+
+        print(f"--- {algorithm} ---")
+        report(
+            "sign   (PEM string)",
+            timeit(lambda: jwt.encode(payload, private_pem, algorithm=algorithm), ITERATIONS),
+        )
+        report(
+            "sign   (pre-parsed key)",
+            timeit(lambda: jwt.encode(payload, keys.signing_key, algorithm=algorithm), ITERATIONS),
+        )
+        report(
+            "verify (PEM string)",
+            timeit(lambda: jwt.decode(token, public_pem, algorithms=[algorithm]), ITERATIONS),
+        )
+        report(
+            "verify (pre-parsed key)",
+            timeit(lambda: jwt.decode(token, verification_key, algorithms=[algorithm]), ITERATIONS),
+        )
+
+
+if __name__ == "__main__":
+    main()
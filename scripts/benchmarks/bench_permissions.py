@@ -0,0 +1,46 @@
+"""
+Compares the legacy list-scan permission check with the compiled
+frozenset + trie matcher as the number of role permissions grows.
+
+Run from the project root:
+    python -m scripts.benchmarks.bench_permissions
+"""
+from scripts.benchmarks._env import report, timeit
+
+from app.security.permissions import CompiledPermissions
+
+ITERATIONS = 20_000
+
+
+def legacy_has_permission(user_permissions: list[str], required_perm: str) -> bool:
+    if required_perm in user_permissions:
+        return True
+    if ":" in required_perm:
+        resource = required_perm.split(":")[0]
+        if f"{resource}:*" in user_permissions:
+            return True
+    return False
+
+
+def main() -> None:
+    for size in (10, 100, 1_000, 10_000):
+        slugs = [f"resource{i}:action{i}" for i in range(size)] + ["billing:*"]
+        compiled = CompiledPermissions(slugs)
+
+        print(f"--- {size} permissions ---")
+        for label, required in (
+            ("miss", "users:delete"),
+            ("wildcard hit", "billing:invoices"),
+        ):
+            report(
+                f"legacy list scan ({label})",
+                timeit(lambda: legacy_has_permission(slugs, required), ITERATIONS),
+            )
+            report(
+                f"compiled matcher ({label})",
+                timeit(lambda: compiled.allows(required), ITERATIONS),
+            )
+
+
+if __name__ == "__main__":
+    main()
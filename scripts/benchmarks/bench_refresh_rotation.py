@@ -0,0 +1,127 @@
+"""
+Refresh token rotation against a real database.
+
+1. Concurrency check: fires CONCURRENCY refreshes of the same token at
+   once, each in its own session, and asserts that exactly one rotates
+   while every other one is rejected as a replay.
+2. Latency: rotates a token chain ITERATIONS times and reports the
+   per-refresh latency.
+
+Needs a migrated Postgres in DATABASE_URL (Redis is optional; without
+it access tokens are issued without version claims). Creates a
+throwaway role and user and deletes them afterwards.
+
+Run from the project root:
+    python -m scripts.benchmarks.bench_refresh_rotation
+"""
+import asyncio
+import statistics
+import time
+import uuid
+
+from scripts.benchmarks._env import bootstrap
+
+bootstrap()
+
+from sqlalchemy import delete, func, select  # noqa: E402
+
+from app.core.exceptions import AuthenticationError  # noqa: E402
+from app.domains.auth.otp_repository import OTPRepository  # noqa: E402
+from app.domains.auth.service import AuthService  # noqa: E402
+from app.domains.users.repository import UserRepository  # noqa: E402
+from app.infrastructure.db.models.auth_rbac import Role  # noqa: E402
+from app.infrastructure.db.models.refresh_token import RefreshToken  # noqa: E402
+from app.infrastructure.db.models.user import User  # noqa: E402
+from app.infrastructure.db.session import AsyncSessionLocal, engine  # noqa: E402
+
+CONCURRENCY = 20
+ITERATIONS = 500
+
+
+async def refresh(token: str) -> str:
+    """One refresh request in its own transaction, like get_db."""
+    async with AsyncSessionLocal() as session:
+        service = AuthService(UserRepository(session), OTPRepository())
+        try:
+            _, new_token = await service.refresh_access_token(token)
+            await session.commit()
+            return new_token
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def create_fixture():
+    async with AsyncSessionLocal() as session:
+        role = Role(name=f"bench-{uuid.uuid4().hex[:8]}")
+        session.add(role)
+        await session.flush()
+
+        user = await UserRepository(session).create(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            first_name="Bench",
+            last_name="Rotation",
+            role_id=role.id,
+        )
+        service = AuthService(UserRepository(session), OTPRepository())
+        token = await service._issue_refresh_token(user)
+        await session.commit()
+        return role.id, user.id, token
+
+
+async def check_concurrency(user_id: uuid.UUID, token: str) -> None:
+    results = await asyncio.gather(
+        *(refresh(token) for _ in range(CONCURRENCY)),
+        return_exceptions=True,
+    )
+    rotated = [r for r in results if isinstance(r, str)]
+    replays = [r for r in results if isinstance(r, AuthenticationError)]
+    unexpected = [r for r in results if not isinstance(r, (str, AuthenticationError))]
+
+    async with AsyncSessionLocal() as session:
+        successors = (await session.execute(
+            select(func.count()).select_from(RefreshToken).where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.replaced_by.is_not(None),
+            )
+        )).scalar_one()
+
+    print(f"{CONCURRENCY} concurrent refreshes: {len(rotated)} rotated, {len(replays)} replays")
+    assert not unexpected, unexpected
+    assert len(rotated) == 1, "exactly one refresh must win"
+    assert len(replays) == CONCURRENCY - 1
+    assert successors == 1, "the token must be replaced exactly once"
+
+
+async def measure_latency() -> None:
+    _, _, token = await create_fixture()
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        token = await refresh(token)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    print(
+        f"rotation latency over {ITERATIONS}: "
+        f"mean {statistics.fmean(samples):.2f} ms, "
+        f"p50 {samples[len(samples) // 2]:.2f} ms, "
+        f"p99 {samples[int(len(samples) * 0.99)]:.2f} ms"
+    )
+
+
+async def main() -> None:
+    role_id, user_id, token = await create_fixture()
+    try:
+        await check_concurrency(user_id, token)
+        await measure_latency()
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(User).where(User.email.like("bench-%@example.com")))
+            await session.execute(delete(Role).where(Role.name.like("bench-%")))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Query-plan checks for the audit log search API.
+
+Inside one transaction that is rolled back at the end, loads ROWS
+synthetic entries spread over TENANTS tenants into the current month's
+audit_logs partition, runs ANALYZE, then EXPLAINs the exact queries
+AuditLogRepository builds and asserts which index serves each one:
+
+- payload containment (@>)          -> GIN jsonb_path_ops (..._payload_idx)
+- tenant page, first and deep       -> (tenant_id, created_at, id)
+- tenant + action                   -> (tenant_id, action, created_at, id)
+- resource history                  -> (resource_type, resource_id, created_at, id)
+
+Needs a migrated Postgres in DATABASE_URL; nothing is left behind.
+
+Run from the project root:
+    python -m scripts.benchmarks.explain_audit_search
+"""
+import asyncio
+import time
+import uuid
+from typing import Iterator, List
+
+from scripts.benchmarks._env import bootstrap
+
+bootstrap()
+
+from sqlalchemy import text  # noqa: E402
+
+from app.domains.audit.repository import AuditLogRepository  # noqa: E402
+from app.infrastructure.db.explain import explain  # noqa: E402
+from app.infrastructure.db.models.tenant import Tenant  # noqa: E402
+from app.infrastructure.db.session import AsyncSessionLocal, engine  # noqa: E402
+
+ROWS = 200_000
+TENANTS = 50
+
+
+def index_names(plan: dict) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from index_names(child)
+
+
+async def load(session) -> List[uuid.UUID]:
+    tenant_ids = []
+    for n in range(TENANTS):
+        tenant = Tenant(name=f"explain-{n}-{uuid.uuid4().hex[:8]}", tenant_status="active")
+        session.add(tenant)
+        await session.flush()
+        tenant_ids.append(tenant.id)
+
+    # Milliseconds apart from now(), so every row lands in the current
+    # month's partition
+    await session.execute(
+        text("""
+        INSERT INTO audit_logs (id, created_at, updated_at, tenant_id, action,
+                                resource_type, resource_id, payload)
+        SELECT gen_random_uuid(),
+               now() + i * interval '1 millisecond',
+               now(),
+               (CAST(:tenant_ids AS uuid[]))[1 + i % :tenants],
+               (ARRAY['users.create', 'users.update', 'roles.update', 'auth.login'])[1 + i % 4],
+               'user',
+               'resource-' || (i % 20000),
+               jsonb_build_object('email', 'user' || i || '@example.com', 'status', 'active')
+        FROM generate_series(1, :rows) AS i
+        """),
+        {"tenant_ids": tenant_ids, "tenants": TENANTS, "rows": ROWS},
+    )
+    await session.execute(text("ANALYZE audit_logs"))
+    return tenant_ids
+
+
+async def check(session, label: str, query, expected: str) -> None:
+    start = time.perf_counter()
+    plan = await explain(session, query)
+    used = sorted(set(index_names(plan[0]["Plan"])))
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{label:<28} {elapsed:>7.2f} ms  {', '.join(used) or 'no index'}")
+    assert any(expected in name for name in used), f"{label}: expected an index matching {expected!r}"
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as session:
+        try:
+            tenant_ids = await load(session)
+            repo = AuditLogRepository(session)
+
+            first_page, _ = await repo.list_keyset(limit=50, tenant_id=tenant_ids[0])
+            after = (first_page[-1].created_at, first_page[-1].id)
+
+            await check(
+                session, "payload containment",
+                repo.keyset_query(limit=51, payload_contains={"email": "user4242@example.com"}),
+                "payload",
+            )
+            await check(
+                session, "tenant, first page",
+                repo.keyset_query(limit=51, tenant_id=tenant_ids[0]),
+                "tenant_id_created_at_id",
+            )
+            await check(
+                session, "tenant, after cursor",
+                repo.keyset_query(limit=51, after=after, tenant_id=tenant_ids[0]),
+                "tenant_id_created_at_id",
+            )
+            await check(
+                session, "tenant + action",
+                repo.keyset_query(limit=51, tenant_id=tenant_ids[1], action="users.update"),
+                "tenant_id_action_created_at_id",
+            )
+            await check(
+                session, "resource history",
+                repo.keyset_query(limit=51, resource_type="user", resource_id="resource-77"),
+                "resource_type_resource_id_created_at_id",
+            )
+        finally:
+            await session.rollback()
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
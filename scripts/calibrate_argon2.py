@@ -0,0 +1,88 @@
+"""
+Picks Argon2id parameters that hit a target verify latency on this machine.
+
+Run from the project root:
+    python -m scripts.calibrate_argon2 --target-ms 250
+
+Copy the printed values into .env. Existing hashes are upgraded
+transparently on each user's next successful login.
+"""
+import argparse
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+SAMPLE_PASSWORD = "calibration-password"
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=32,
+        salt_len=16,
+    )
+    hashed = hasher.hash(SAMPLE_PASSWORD)
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify(hashed, SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int, max_time_cost: int, samples: int):
+    """
+    Memory is the main defence against GPU cracking, so it is kept fixed
+    and only halved when even a single pass is slower than the target.
+    Then time_cost grows until the target latency is reached.
+    """
+    while True:
+        latency = measure_verify_ms(1, memory_cost, parallelism, samples)
+        print(f"  t=1  m={memory_cost:>7} KiB  p={parallelism}  -> {latency:7.1f} ms")
+        # Argon2 requires at least 8 KiB per lane
+        if latency <= target_ms or memory_cost // 2 < 8 * parallelism:
+            break
+        memory_cost //= 2
+
+    chosen = (1, latency)
+    for time_cost in range(2, max_time_cost + 1):
+        latency = measure_verify_ms(time_cost, memory_cost, parallelism, samples)
+        print(f"  t={time_cost:<2} m={memory_cost:>7} KiB  p={parallelism}  -> {latency:7.1f} ms")
+        if latency > target_ms:
+            break
+        chosen = (time_cost, latency)
+
+    return chosen[0], memory_cost, chosen[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="target verify latency")
+    parser.add_argument("--memory-mib", type=int, default=64, help="starting memory cost in MiB")
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=5, help="verifications per candidate")
+    args = parser.parse_args()
+
+    print(f"Calibrating Argon2id for ~{args.target_ms:.0f} ms per verification...")
+    time_cost, memory_cost, latency = calibrate(
+        target_ms=args.target_ms,
+        memory_cost=args.memory_mib * 1024,
+        parallelism=args.parallelism,
+        max_time_cost=args.max_time_cost,
+        samples=args.samples,
+    )
+
+    print(f"\nSelected parameters (~{latency:.1f} ms):\n")
+    print(f"PASSWORD_HASH_TIME_COST={time_cost}")
+    print(f"PASSWORD_HASH_MEMORY_COST={memory_cost}")
+    print(f"PASSWORD_HASH_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ from app.infrastructure.db.models.tenant import Tenant
 from app.infrastructure.db.models.user import User
 from app.infrastructure.db.models.user_auth_method import UserAuthMethod, AuthMethodType
 from app.infrastructure.db.models.auth_rbac import Role, Permission
-from app.security.hashing import hash_password
+from app.security.hashing import hash_password_async
 
 # 1. Define Permissions with Wildcards
 SYSTEM_PERMISSIONS = [
@@ -15,9 +15,11 @@ SYSTEM_PERMISSIONS = [
     {"slug": "users:*", "description": "Full control over all user actions"},
     {"slug": "roles:*", "description": "Full control over all role actions"},
     {"slug": "tenants:*", "description": "Full control over all tenant actions"},
+    {"slug": "audit:*", "description": "Full access to the audit trail"},
     # Granular (for standard users)
     {"slug": "users:view", "description": "View user profiles"},
     {"slug": "billing:view", "description": "View tenant billing"},
+    {"slug": "audit:view", "description": "View the tenant audit trail"},
 ]
 
 async def seed_data():
@@ -50,7 +52,7 @@ async def seed_data():
                     name="Super Admin",
                     description="Global system owner with full wildcard access",
                     is_system_role=True,
-                    permissions=[permission_map["users:*"], permission_map["roles:*"], permission_map["tenants:*"]]
+                    permissions=[permission_map["users:*"], permission_map["roles:*"], permission_map["tenants:*"], permission_map["audit:*"]]
                 )
                 session.add(super_admin_role)
                 print("  + Added Super Admin role")
@@ -84,7 +86,7 @@ async def seed_data():
                 auth = UserAuthMethod(
                     user_id=super_admin.id,
                     auth_type=AuthMethodType.PASSWORD,
-                    password_hash=hash_password("system123")
+                    password_hash=await hash_password_async("system123")
                 )
                 session.add(auth)
                 print(f"  + Created Global Super Admin: {admin_email}")